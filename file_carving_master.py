@@ -21,7 +21,7 @@
 [주요 특징]
 - 병렬 처리: ThreadPoolExecutor를 사용해 여러 워커와 동시 통신
 - 스트리밍 전송: 대용량 파일도 메모리 부족 없이 처리 (4MB 단위)
-- 중복 제거: MD5 해시로 동일 파일 자동 제거
+- 중복 제거: 해시(blake3 또는 SHA-256)로 동일 파일 자동 제거
 - 실시간 진행률: ANSI escape code로 멀티라인 진행률 표시
 
 ================================================================================
@@ -59,6 +59,12 @@ from pathlib import Path  # 파일 경로를 객체지향적으로 다루는 클
                           # 문자열보다 안전하고 편리한 경로 처리 가능
                           # 예: Path("folder") / "file.txt" -> "folder/file.txt"
 
+from collections import deque  # 양쪽 끝 삽입/삭제가 O(1)인 큐 자료구조
+                               # 워커별 작업 큐로 사용
+
+import queue           # 스레드 안전 큐 (송신 스레드 -> 수신 스레드 전달용)
+                       # get()이 블로킹이라 조건 변수 없이 대기 가능
+
 from concurrent.futures import ThreadPoolExecutor, as_completed
 # ThreadPoolExecutor: 스레드 풀을 관리하는 고수준 인터페이스
 #   - 스레드 풀: 미리 생성해둔 스레드들을 재사용하는 방식
@@ -95,6 +101,85 @@ JSON_LEN_SIZE = 4        # 길이 필드 크기: 4바이트
 BIN_LEN_FMT = "!Q"       # 8바이트 부호 없는 정수 (최대 약 16EB)
 BIN_LEN_SIZE = 8         # 길이 필드 크기: 8바이트
 
+# 미리 컴파일된 Struct 객체
+# struct.pack/unpack은 호출마다 포맷 문자열을 파싱하지만,
+# Struct 객체는 파싱을 한 번만 하고 pack/unpack 메서드를 재사용함
+# (메시지 수천 건이 오가는 제어 경로의 상수 비용 절감)
+JSON_LEN_STRUCT = struct.Struct(JSON_LEN_FMT)
+BIN_LEN_STRUCT = struct.Struct(BIN_LEN_FMT)
+
+# 작업(task) 분할의 최소 크기 (64MB)
+# 작업이 너무 잘게 나뉘면 작업당 왕복(JSON + 카빙 준비) 비용이 커지고,
+# 너무 크면 빠른 워커가 먼저 끝나고 노는 시간이 길어짐
+TASK_SIZE_MIN = 64 * 1024 * 1024
+
+# 워커 연결의 소켓 송수신 버퍼 크기 (16MB, 워커 쪽 설정과 동일)
+# 커널 기본값(자동 튜닝 ~수백 KB)은 고대역폭 LAN에서 단일 스트림
+# 대역폭을 제한함 - BDP(대역폭 x 지연)만큼 데이터가 비행 중일 수
+# 있어야 링크를 가득 채울 수 있음
+SOCKET_BUF_SIZE = 16 * 1024 * 1024
+# 주의: setsockopt로 요청한 값은 커널 상한(net.core.rmem_max /
+# net.core.wmem_max, 기본 수백 KB)으로 잘립니다. 10GbE 이상에서
+# 16MB를 실제로 쓰려면 관리자가 sysctl로 상한을 올려야 합니다:
+#   sysctl -w net.core.rmem_max=16777216 net.core.wmem_max=16777216
+
+# 중복 검사용 해시 함수
+# blake3가 설치되어 있으면 사용 (SIMD 병렬화로 수 GB/s), 없으면
+# hashlib.sha256으로 폴백 (OpenSSL이 SHA-NI 명령을 자동 사용).
+# 둘 다 MD5보다 빠르며, blake3는 선택 의존성이라 없어도 동작합니다.
+try:
+    from blake3 import blake3 as new_dedupe_hash
+except ImportError:
+    new_dedupe_hash = hashlib.sha256
+
+# JSON 직렬화 함수
+# orjson이 설치되어 있으면 사용 (Rust 구현 - bytes를 직접 입출력하므로
+# UTF-8 인코딩/디코딩 단계가 사라지고 파싱도 수 배 빠름), 없으면
+# 표준 json으로 폴백. blake3처럼 선택 의존성이라 없어도 동작합니다.
+try:
+    from orjson import dumps as json_dumps_bytes   # dict -> bytes
+    from orjson import loads as json_loads_bytes   # bytes -> dict
+except ImportError:
+    def json_dumps_bytes(obj):
+        # separators: 구분자 뒤 공백 제거 (orjson과 같은 압축 형식)
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_loads_bytes(payload):
+        return json.loads(payload.decode("utf-8"))
+
+# 플랫폼별 시스템 콜 지원 여부
+# sendmsg(vectored I/O)와 pread는 Windows의 Python에 없으므로,
+# 미지원 플랫폼에서는 기능이 같은 폴백(버퍼별 sendall / seek+read)을
+# 사용합니다. 속도만 다르고 동작과 와이어 형식은 동일합니다 (워커와 동일).
+HAVE_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+if hasattr(os, "pread"):
+    _pread = os.pread
+else:
+    # Windows 폴백: lseek+read는 fd의 파일 포지션을 공유하는데,
+    # 워커 스레드들이 공유 이미지 fd를 동시에 읽으므로 락으로 직렬화
+    _pread_lock = threading.Lock()
+
+    def _pread(fd, n, offset):
+        with _pread_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, n)
+
+# 이 크기 이하의 복구 파일은 메모리로 받은 뒤 한 번에 기록
+# 임시 파일 쓰기 -> replace(rename) -> (중복이면) unlink로 파일당
+# 서너 번 발생하던 파일시스템 메타데이터 연산이, 고유 파일은 쓰기
+# 1회로 줄고 중복 파일은 디스크에 닿지도 않음
+RESULT_MEMORY_MAX = 8 * 1024 * 1024
+
+# 익명 임시 파일 플래그 (Linux 3.11+)
+# O_TMPFILE로 디렉토리를 열면 이름 없는 파일이 생성됩니다.
+# 중복이면 close()만으로 커널이 회수하고(unlink 불필요), 고유하면
+# /proc/self/fd/N 경로로 link()하여 그 순간 이름이 생깁니다.
+# rename 경쟁도, 크래시 시 남는 __tmp 파일도 없습니다.
+# 미지원 환경(다른 OS, 일부 파일시스템)에서는 0이 되어
+# 기존의 "이름 있는 임시 파일 + replace" 경로로 폴백합니다.
+O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+
 
 # ============================================================================
 # 유틸리티 함수 (Utility Functions)
@@ -197,39 +282,61 @@ class MultiProgressDisplay:
     - [K  : 커서부터 줄 끝까지 지우기
     
     [멀티스레딩 고려사항]
-    여러 스레드가 동시에 화면을 업데이트하면 출력이 섞일 수 있으므로,
-    threading.Lock을 사용하여 한 번에 하나의 스레드만 출력하도록 합니다.
-    
+    렌더링은 전용 티커 스레드 한 곳에서만 수행합니다 (_tick 참고).
+    워커 스레드의 update()/set_phase()는 상태 딕셔너리에 값을 대입만
+    하고 화면은 건드리지 않습니다. CPython에서 딕셔너리 항목 대입은
+    원자적이므로 락 없이도 안전하며, 티커가 잠깐 이전 값을 읽어도
+    다음 렌더링(0.1초 뒤)에 바로 따라잡히는 표시용 데이터일 뿐입니다.
+
+    [왜 호출자가 렌더링하지 않는가?]
+    이전에는 update()마다 락을 잡고 N줄 전체를 다시 그렸습니다.
+    워커가 많아지면 진행률 갱신 경로가 락 경쟁 + stdout flush로
+    직렬화됩니다. 렌더링을 티커 한 곳으로 모으면 틱당 쓰기/flush가
+    정확히 1회가 되고, 워커 스레드의 갱신 비용은 대입 몇 번뿐입니다.
+
     [사용 예시]
     >>> display = MultiProgressDisplay(3)  # 3개 워커
     >>> display.init_display()
     >>> display.update(0, 5000, 'sending')  # 워커 0의 진행률 업데이트
     """
-    
+
+    # 티커 렌더링 주기 (초) - 10Hz면 사람 눈에 연속으로 보이기 충분
+    RENDER_INTERVAL = 0.1
+
     def __init__(self, num_workers):
         """
         MultiProgressDisplay 생성자
-        
+
         [매개변수]
         num_workers (int): 워커의 총 개수
         """
         self.num_workers = num_workers  # 워커 개수
-        
+
         # threading.Lock(): 상호 배제(mutual exclusion) 락
-        # 여러 스레드가 동시에 공유 자원에 접근하는 것을 방지
-        # with self.lock: 구문으로 사용하면 자동으로 acquire/release 됨
+        # 초기화(init_display)의 1회성 보호에만 사용
+        # (진행률 갱신/렌더링 경로는 락을 쓰지 않음 - 클래스 docstring 참고)
         self.lock = threading.Lock()
-        
+
+        # 티커 스레드 제어
+        self._stop = threading.Event()  # finish()가 설정하면 티커 종료
+        self._ticker = None             # 렌더링 전용 데몬 스레드
+
         self.worker_states = {}  # 각 워커의 현재 상태를 저장하는 딕셔너리
         self.initialized = False  # 초기 화면 출력 여부
         self.bar_width = 20       # 프로그레스 바의 문자 폭
-        
+
+        # 가능한 프로그레스 바 문자열은 bar_width+1가지뿐이므로 미리 생성
+        # (렌더링 틱마다 '█'*n + '░'*m 문자열 2개를 새로 만들지 않도록)
+        self._bars = ['█' * i + '░' * (self.bar_width - i)
+                      for i in range(self.bar_width + 1)]
+
         # 각 워커의 초기 상태 설정
         for i in range(num_workers):
             self.worker_states[i] = {
                 'phase': 'waiting',    # 현재 단계: waiting, sending, carving, receiving, done, error
                 'current': 0,          # 현재까지 처리한 바이트 수
                 'total': 0,            # 전체 처리해야 할 바이트 수
+                'total_fmt': '0.00B',  # total의 문자열 캐시 (set_worker_info에서 갱신)
                 'start_time': None,    # 전송 시작 시간 (속도 계산용)
                 'address': '',         # 워커의 IP 주소
                 'message': ''          # 추가 메시지
@@ -249,7 +356,24 @@ class MultiProgressDisplay:
                 for i in range(self.num_workers):
                     print(f"[워커 {i}] 초기화 중...")
                 self.initialized = True
-    
+
+                # 렌더링 전용 티커 스레드 시작
+                # daemon=True: 메인 스레드 종료 시 함께 종료
+                self._ticker = threading.Thread(target=self._tick, daemon=True)
+                self._ticker.start()
+
+    def _tick(self):
+        """
+        티커 스레드 본체 - RENDER_INTERVAL마다 화면을 다시 그립니다.
+
+        [동작 원리]
+        Event.wait(timeout)은 타임아웃까지 대기하다가 False를 반환하고,
+        finish()가 _stop을 설정하면 즉시 True를 반환하며 루프가 끝납니다.
+        (time.sleep과 달리 종료 신호에 바로 반응)
+        """
+        while not self._stop.wait(self.RENDER_INTERVAL):
+            self._render_all()
+
     def set_worker_info(self, worker_id, address, total):
         """
         워커의 기본 정보를 설정합니다.
@@ -259,10 +383,17 @@ class MultiProgressDisplay:
         address (str): 워커의 IP 주소
         total (int): 전송할 총 바이트 수
         """
-        with self.lock:
-            self.worker_states[worker_id]['address'] = address
-            self.worker_states[worker_id]['total'] = total
-    
+        state = self.worker_states[worker_id]
+        state['address'] = address
+        # 같은 워커가 작업을 여러 개 처리할 수 있으므로
+        # 작업마다 진행량/시작 시간을 초기화
+        state['current'] = 0
+        state['start_time'] = None
+        state['total'] = total
+        # total은 작업 동안 상수이므로 문자열 변환을 여기서 한 번만 수행
+        # (렌더링 틱마다 format_size를 다시 돌리지 않도록 캐시)
+        state['total_fmt'] = format_size(total)
+
     def update(self, worker_id, current, phase='sending', message=None):
         """
         특정 워커의 진행률을 업데이트합니다.
@@ -273,21 +404,18 @@ class MultiProgressDisplay:
         phase (str): 현재 단계 ('sending', 'carving', 'receiving', 'done', 'error')
         message (str, optional): 추가 메시지
         """
-        with self.lock:
-            state = self.worker_states[worker_id]
-            state['current'] = current
-            state['phase'] = phase
-            
-            # 전송 시작 시간 기록 (속도 계산을 위해)
-            if state['start_time'] is None and phase == 'sending':
-                state['start_time'] = time.time()
-            
-            if message:
-                state['message'] = message
-            
-            # 화면 갱신
-            self._render_all()
-    
+        # 값 대입만 수행 - 렌더링은 티커 스레드가 담당 (락/flush 없음)
+        state = self.worker_states[worker_id]
+        state['current'] = current
+        state['phase'] = phase
+
+        # 전송 시작 시간 기록 (속도 계산을 위해)
+        if state['start_time'] is None and phase == 'sending':
+            state['start_time'] = time.time()
+
+        if message:
+            state['message'] = message
+
     def set_phase(self, worker_id, phase, message=None):
         """
         워커의 단계(phase)만 변경합니다.
@@ -297,12 +425,11 @@ class MultiProgressDisplay:
         phase (str): 변경할 단계
         message (str, optional): 표시할 메시지
         """
-        with self.lock:
-            self.worker_states[worker_id]['phase'] = phase
-            if message:
-                self.worker_states[worker_id]['message'] = message
-            self._render_all()
-    
+        # 값 대입만 수행 - 렌더링은 티커 스레드가 담당
+        if message:
+            self.worker_states[worker_id]['message'] = message
+        self.worker_states[worker_id]['phase'] = phase
+
     def _render_all(self):
         """
         모든 워커의 상태를 화면에 렌더링합니다.
@@ -313,30 +440,36 @@ class MultiProgressDisplay:
         3. flush()로 버퍼를 즉시 출력
         
         [주의사항]
-        이 메서드는 lock이 이미 획득된 상태에서만 호출해야 합니다.
+        이 메서드는 티커 스레드(_tick)와 티커 종료 후의 finish()에서만
+        호출해야 합니다 - 렌더러가 한 곳이어야 출력이 섞이지 않습니다.
         (private 메서드이므로 _ 접두사 사용)
         """
+        # 현재 시각은 렌더링 패스당 한 번만 조회 (워커마다 재호출 방지,
+        # 같은 틱의 모든 줄이 동일한 기준 시각으로 속도/ETA를 계산)
+        now = time.time()
+
         # 커서를 워커 수만큼 위로 이동
         # \033[nA : n줄 위로 이동하는 ANSI escape code
         sys.stdout.write(f"\033[{self.num_workers}A")
-        
+
         # 각 워커의 상태를 출력
         for i in range(self.num_workers):
-            line = self._format_worker_line(i, self.worker_states[i])
+            line = self._format_worker_line(i, self.worker_states[i], now)
             # \033[K : 현재 커서 위치부터 줄 끝까지 지우기
             sys.stdout.write(f"\033[K{line}\n")
         
         # 버퍼를 즉시 출력 (버퍼링 없이 바로 화면에 표시)
         sys.stdout.flush()
     
-    def _format_worker_line(self, worker_id, state):
+    def _format_worker_line(self, worker_id, state, now=None):
         """
         워커 한 줄의 출력 문자열을 생성합니다.
-        
+
         [매개변수]
         worker_id (int): 워커 번호
         state (dict): 워커의 현재 상태 딕셔너리
-        
+        now (float, optional): 렌더링 기준 시각 (없으면 time.time() 호출)
+
         [반환값]
         str: 포맷팅된 문자열 (예: "[워커 0] 192.168.1.100   | ████████░░░░ | 65.3% | ...")
         """
@@ -359,14 +492,15 @@ class MultiProgressDisplay:
             # 백분율 계산 (0으로 나누기 방지)
             percent = (current / total * 100) if total > 0 else 0
             
-            # 프로그레스 바 생성
-            # filled: 채워진 블록 수
+            # 프로그레스 바 선택
+            # filled: 채워진 블록 수 (미리 만들어 둔 바 문자열의 인덱스)
             filled = int(self.bar_width * current / total) if total > 0 else 0
-            # █: 채워진 부분, ░: 빈 부분
-            bar = '█' * filled + '░' * (self.bar_width - filled)
+            bar = self._bars[min(filled, self.bar_width)]
             
             # 전송 속도 계산
-            elapsed = time.time() - state['start_time'] if state['start_time'] else 0
+            if now is None:
+                now = time.time()
+            elapsed = now - state['start_time'] if state['start_time'] else 0
             speed = current / elapsed if elapsed > 0 else 0
             
             # 남은 시간(ETA) 계산
@@ -379,7 +513,7 @@ class MultiProgressDisplay:
             # {:5.1f} : 전체 5자리, 소수점 1자리
             # :>8 : 오른쪽 정렬, 8자리
             return (f"[워커 {worker_id}] {addr} | {bar} | {percent:5.1f}% | "
-                   f"{format_size(current):>8}/{format_size(total):>8} | "
+                   f"{format_size(current):>8}/{state['total_fmt']:>8} | "
                    f"{format_speed(speed):>10} | 남은: {eta}")
         
         elif phase == 'carving':
@@ -406,10 +540,14 @@ class MultiProgressDisplay:
     def finish(self):
         """
         진행률 표시를 종료합니다.
-        현재는 특별한 동작 없이 락만 획득했다가 해제합니다.
+        티커 스레드를 멈추고 최종 상태를 한 번 더 그립니다.
+        (마지막 틱 이후에 바뀐 상태가 화면에 남도록)
         """
-        with self.lock:
-            pass  # 커서가 이미 맨 아래에 있으므로 추가 작업 불필요
+        self._stop.set()  # 티커 루프 종료 신호
+        if self._ticker is not None:
+            self._ticker.join(timeout=2)
+        if self.initialized:
+            self._render_all()  # 최종 상태 출력
 
 
 # ============================================================================
@@ -449,32 +587,43 @@ class FileCarvingMaster:
     - recovered_files: 복구된 파일 정보 리스트
     """
     
-    def __init__(self, port=5000, overlap_size=1 * 1024 * 1024, stream_block_size=4 * 1024 * 1024):
+    def __init__(self, port=5000, overlap_size=1 * 1024 * 1024,
+                 stream_block_size=4 * 1024 * 1024, task_size=0):
         """
         FileCarvingMaster 생성자
-        
+
         [매개변수]
         port (int): 서버가 사용할 포트 번호 (기본값: 5000)
             - 포트: 하나의 IP에서 여러 서비스를 구분하는 번호
             - 0-1023: Well-known ports (시스템 예약)
             - 1024-49151: Registered ports
             - 49152-65535: Dynamic/Private ports
-            
+
         overlap_size (int): 청크 간 오버랩 크기 (기본값: 1MB)
             - 청크 경계에 걸친 JPEG 파일을 복구하기 위함
             - 예: JPEG가 청크 0 끝과 청크 1 시작에 걸쳐있는 경우
-            
+
         stream_block_size (int): 스트리밍 블록 크기 (기본값: 4MB)
             - 대용량 데이터를 한 번에 메모리에 올리지 않고
               작은 블록 단위로 읽어서 전송
+
+        task_size (int): 작업 분할 크기 (기본값: 0 = 자동)
+            - 이미지를 이 크기 단위의 작업으로 나누어 분배
+            - 워커 담당분을 통째로 하나의 작업으로 주면 느린 워커
+              하나가 전체 완료 시간을 지배함 (정적 분할의 손실).
+              작업을 잘게 나누면 먼저 끝난 워커가 남의 작업을
+              가져가며(work stealing) 불균형을 흡수함
+            - 자동: 워커 담당분의 1/4 (최소 TASK_SIZE_MIN)
         """
         self.port = port
         self.overlap_size = overlap_size
         self.stream_block_size = stream_block_size
+        self.task_size = task_size
 
         self.workers = []          # 연결된 워커들의 정보 리스트
         self.dd_image_path = None  # DD 이미지 파일 경로 (Path 객체)
         self.image_size = 0        # DD 이미지 전체 크기 (바이트)
+        self.image_fd = None       # 공유 이미지 파일 디스크립터 (load_dd_image에서 설정)
 
         # 복구된 파일을 저장할 디렉토리
         # Path 객체의 mkdir(): 디렉토리 생성
@@ -483,16 +632,41 @@ class FileCarvingMaster:
         self.results_dir.mkdir(exist_ok=True)
 
         # set(): 중복을 허용하지 않는 집합 자료구조
-        # 파일의 MD5 해시를 저장하여 중복 파일 검사에 사용
+        # 파일의 해시(new_dedupe_hash: blake3 또는 SHA-256)를 저장하여
+        # 중복 파일 검사에 사용
         self.file_hashes = set()
-        
+
+        # 이미 처리한 (절대 오프셋, 크기) 쌍의 집합
+        # 오버랩 영역에서는 인접 워커들이 같은 파일을 같은 절대 오프셋에서
+        # 발견합니다. 오프셋과 크기가 모두 같으면 이미지의 같은 바이트
+        # 구간이므로 내용도 같습니다 - 해시를 계산하거나 디스크에 쓰지
+        # 않고 본문만 읽어 버리면 됩니다 (receive_results 참고)
+        self.offset_sizes = set()
+
         # 멀티스레딩 환경에서 공유 자원 보호를 위한 락
         self.lock = threading.Lock()
-        
+
+        # 스레드별 수신 버퍼 저장소
+        # 워커마다 별도 스레드가 수신하므로 버퍼를 공유하면 서로 덮어씀
+        # threading.local(): 스레드마다 독립된 속성 공간을 제공
+        self._tls = threading.local()
+
+        # O_TMPFILE + link() 사용 가능 여부 (None = 아직 검사 안 함)
+        # 첫 대용량 결과 수신 시 _o_tmpfile_usable()이 한 번 검사하고 캐시
+        self._use_o_tmpfile = None
+
         self.recovered_files = []  # 복구된 파일 정보 리스트
-        
+
         self.progress_display = None  # 진행률 표시 객체
 
+        # 워커별 작업 큐 (distribute_and_collect_parallel에서 초기화)
+        # 전역 큐 하나를 공유하면 모든 워커 스레드가 pop마다 같은 락을
+        # 두고 경쟁하므로, 워커마다 전용 deque + 전용 락으로 분할(shard)
+        # 합니다. 평상시에는 자기 큐만 만지므로 락 경쟁이 없고,
+        # 자기 큐가 비면 다른 워커의 큐에서 가져옵니다(work stealing).
+        self.worker_tasks = []  # 워커별 deque 리스트
+        self.task_locks = []    # 워커별 락 리스트 (pop vs steal 경쟁 보호)
+
     def load_dd_image(self, image_path: str) -> bool:
         """
         DD 이미지 파일을 로드합니다.
@@ -522,11 +696,17 @@ class FileCarvingMaster:
             return False
 
         self.dd_image_path = p
-        
+
         # stat(): 파일의 메타데이터(크기, 수정시간 등) 반환
         # st_size: 파일 크기 (바이트)
         self.image_size = p.stat().st_size
 
+        # 이미지 파일 디스크립터를 하나만 열어 모든 워커 스레드가 공유
+        # 스레드마다 open()하면 파일 포지션 상태가 각각 생기고 seek가
+        # 필요하지만, os.pread / os.sendfile(오프셋 지정)은 포지션을
+        # 건드리지 않는 무상태(stateless) 호출이라 fd 하나로 충분합니다.
+        self.image_fd = os.open(str(p), os.O_RDONLY)
+
         print(f"[마스터] DD 이미지 로드: {p}")
         # :, -> 천 단위 구분 기호 추가 (예: 1,234,567)
         print(f"[마스터] 이미지 크기: {self.image_size:,} bytes ({format_size(self.image_size)})")
@@ -554,29 +734,51 @@ class FileCarvingMaster:
                연결이 끊어지면 빈 bytes 반환
         
         [동작 원리]
-        1. bytearray에 받은 데이터를 계속 추가
+        1. 스레드별 재사용 버퍼에 recv_into로 직접 수신
         2. 원하는 크기가 될 때까지 반복
-        3. 연결이 끊어지면 (recv가 빈 값 반환) 빈 bytes 반환
+        3. 연결이 끊어지면 (recv_into가 0 반환) 빈 bytes 반환
+
+        recv()는 호출마다 새 bytes를 할당하고 extend()가 한 번 더
+        복사하지만, recv_into()는 미리 준비한 버퍼에 커널이 직접
+        기록하므로 수신 호출당 할당/복사가 사라집니다. 버퍼는
+        스레드마다 하나씩 유지됩니다 (워커 스레드끼리 공유 금지).
         """
-        # bytearray: 수정 가능한 바이트 시퀀스
-        # bytes는 불변(immutable)이지만 bytearray는 가변(mutable)
-        buf = bytearray()
-        
-        while len(buf) < size:
-            # recv(): 소켓에서 데이터 수신
-            # min(65536, size - len(buf)): 남은 크기와 64KB 중 작은 값
-            # 64KB(65536)는 일반적인 TCP 버퍼 크기
-            chunk = sock.recv(min(65536, size - len(buf)))
-            
-            # recv()가 빈 값을 반환하면 연결이 끊어진 것
-            if not chunk:
+        buf = self._recv_buffer(size)
+        mv = memoryview(buf)
+
+        filled = 0  # 지금까지 채운 바이트 수
+        while filled < size:
+            # recv_into(버퍼): 소켓 데이터를 버퍼에 직접 기록, 기록한 크기 반환
+            # MSG_WAITALL: 요청한 크기가 다 모일 때까지 커널이 대기
+            # -> 정상 경로에서는 메시지당 시스템 콜이 1회로 끝남
+            # (시그널 등으로 짧게 반환될 수 있으므로 루프는 유지)
+            got = sock.recv_into(mv[filled:size], 0, socket.MSG_WAITALL)
+
+            # 0을 반환하면 연결이 끊어진 것
+            if got == 0:
                 return b""  # 빈 bytes 반환
-            
-            # extend(): bytearray에 데이터 추가
-            buf.extend(chunk)
-        
-        # bytes로 변환하여 반환
-        return bytes(buf)
+
+            filled += got
+
+        # bytes 타입으로 변환하여 반환 (버퍼는 다음 호출에서 재사용됨)
+        return bytes(mv[:size])
+
+    def _recv_buffer(self, size: int = 0) -> bytearray:
+        """
+        현재 스레드 전용 수신 버퍼를 반환합니다 (필요하면 생성/확장).
+
+        [매개변수]
+        size (int): 버퍼가 담아야 할 최소 크기 (기본 0 = 기존 크기 유지)
+
+        [반환값]
+        bytearray: 이 스레드의 재사용 수신 버퍼 (최소 1MB)
+        """
+        buf = getattr(self._tls, "recv_buf", None)
+        if buf is None or len(buf) < size:
+            # 최초 호출이거나 요청이 버퍼보다 크면 (재)할당
+            buf = bytearray(max(size, 1024 * 1024))
+            self._tls.recv_buf = buf
+        return buf
 
     def send_json(self, sock: socket.socket, obj: dict) -> None:
         """
@@ -598,18 +800,65 @@ class FileCarvingMaster:
         [사용 예시]
         >>> master.send_json(sock, {"status": "ok", "count": 5})
         """
-        # json.dumps(): 딕셔너리 -> JSON 문자열
-        # encode("utf-8"): 문자열 -> 바이트
-        payload = json.dumps(obj).encode("utf-8")
-        
-        # struct.pack(): Python 값을 바이트로 변환
-        # "!I": 네트워크 바이트 순서, unsigned int (4바이트)
-        # 길이 정보를 먼저 전송
-        sock.sendall(struct.pack(JSON_LEN_FMT, len(payload)))
-        
         # sendall(): 모든 데이터가 전송될 때까지 대기
         # send()와 달리 부분 전송 걱정 없음
-        sock.sendall(payload)
+        # 길이 + 페이로드를 하나의 버퍼로 만들어 한 번에 전송
+        sock.sendall(self._encode_json_frame(obj))
+
+    def _encode_json_frame(self, obj: dict) -> bytes:
+        """
+        딕셔너리를 [4바이트 길이][JSON] 프레임 바이트로 인코딩합니다.
+
+        send_json이 사용하는 것 외에, 다른 전송과 프레임을 하나의
+        sendmsg로 묶어 보낼 때(예: 작업 JSON + 청크 헤더)도 사용합니다.
+
+        [매개변수]
+        obj (dict): 인코딩할 딕셔너리
+
+        [반환값]
+        bytes: 전송 가능한 프레임 (길이 프리픽스 포함)
+        """
+        # 딕셔너리 -> JSON bytes (orjson 또는 표준 json - 상단 참고)
+        payload = json_dumps_bytes(obj)
+
+        # struct.pack(): Python 값을 바이트로 변환
+        # "!I": 네트워크 바이트 순서, unsigned int (4바이트)
+        return JSON_LEN_STRUCT.pack(len(payload)) + payload
+
+    def _send_vec(self, sock: socket.socket, bufs) -> None:
+        """
+        여러 버퍼를 한 번의 sendmsg() 시스템 콜로 전송합니다 (vectored I/O).
+
+        [왜 필요한가?]
+        sendall()을 버퍼마다 호출하면 버퍼 수만큼 커널 진입/복귀가
+        발생합니다. sendmsg()는 버퍼 리스트(scatter-gather)를 받아
+        한 번의 시스템 콜로 전송하므로, 헤더+첫 블록처럼 붙어 나가는
+        버퍼들이나 미리 읽어둔 블록 여러 개를 시스템 콜 하나로 보냅니다.
+
+        [매개변수]
+        sock (socket.socket): 데이터를 보낼 소켓
+        bufs (list): 전송할 버퍼(bytes/memoryview) 리스트
+        """
+        if not HAVE_SENDMSG:
+            # sendmsg 미지원 플랫폼(Windows): 버퍼별 sendall 폴백
+            # 시스템 콜이 버퍼 수만큼 늘지만 전송 결과는 동일
+            for b in bufs:
+                if len(b) > 0:
+                    sock.sendall(b)
+            return
+
+        # sendmsg는 일부만 전송할 수 있으므로 전부 나갈 때까지 반복
+        views = [memoryview(b) for b in bufs if len(b) > 0]
+        while views:
+            n = sock.sendmsg(views)
+            # 전송된 n바이트만큼 앞쪽 버퍼들을 소진 처리
+            while n > 0:
+                if n >= len(views[0]):
+                    n -= len(views[0])
+                    views.pop(0)
+                else:
+                    views[0] = views[0][n:]
+                    n = 0
 
     def recv_json(self, sock: socket.socket):
         """
@@ -637,121 +886,340 @@ class FileCarvingMaster:
         
         # struct.unpack(): 바이트 -> Python 값
         # [0]: unpack은 튜플을 반환하므로 첫 번째 요소 추출
-        size = struct.unpack(JSON_LEN_FMT, size_b)[0]
+        size = JSON_LEN_STRUCT.unpack(size_b)[0]
         
         # 2. JSON 데이터 수신
         payload = self._recv_exact(sock, size)
         if not payload:
             return None
         
-        # 3. JSON 파싱
-        # decode("utf-8"): 바이트 -> 문자열
-        # json.loads(): JSON 문자열 -> 딕셔너리
-        return json.loads(payload.decode("utf-8"))
+        # 3. JSON 파싱 (orjson 또는 표준 json - 상단 json_loads_bytes 참고)
+        return json_loads_bytes(payload)
+
+    # 한 번의 sendmsg로 묶어 보낼 블록 수
+    # 4개 x 4MB = 16MB가 배치당 메모리 상한 (블록 크기 기본값 기준)
+    SEND_BATCH_BLOCKS = 4
 
-    def send_binary_stream_with_progress(self, sock: socket.socket, file_path: Path, 
-                                         start: int, end: int, worker_id: int) -> None:
+    # 워커당 동시 진행(in-flight) 작업 수 상한 (크레딧)
+    # 2 = 더블 버퍼링: 워커가 작업 N을 카빙하는 동안 작업 N+1의 청크가
+    # 네트워크를 타고 감. 더 키우면 소켓/커널 버퍼에 데이터만 쌓이고
+    # (워커는 어차피 한 번에 하나씩 처리) 메모리 압박만 커짐
+    MAX_INFLIGHT_TASKS = 2
+
+    def send_binary_stream_with_progress(self, sock: socket.socket,
+                                         start: int, end: int, worker_id: int,
+                                         prefix: bytes = b"") -> None:
         """
-        파일의 특정 구간을 진행률을 표시하면서 스트리밍 전송합니다.
-        
+        DD 이미지의 특정 구간을 진행률을 표시하면서 스트리밍 전송합니다.
+
         [스트리밍이란?]
         대용량 데이터를 한 번에 메모리에 올리지 않고,
         작은 청크 단위로 읽어서 바로 전송하는 방식입니다.
-        30GB 파일도 4MB만 메모리에 올려서 처리할 수 있습니다.
-        
+        30GB 파일도 몇 블록만 메모리에 올려서 처리할 수 있습니다.
+
+        [시스템 콜 병합]
+        prefix(예: 작업 JSON 프레임) + 8바이트 길이 + 첫 블록을 하나의
+        sendmsg로 보냅니다 (작은 제어 데이터가 별도 세그먼트로 나가지
+        않도록).
+
+        [sendfile - 커널 내부 전송]
+        본문은 가능하면 os.sendfile()로 전송합니다. read() + send()는
+        블록마다 커널->사용자, 사용자->커널 복사가 한 번씩 일어나지만,
+        sendfile은 페이지 캐시에서 소켓으로 커널 안에서 바로 옮기므로
+        수 GB 이미지를 스트리밍할 때 바이트당 메모리 대역폭 소모가
+        크게 줄어듭니다. 미지원 플랫폼/파일시스템에서는 블록을
+        SEND_BATCH_BLOCKS개씩 미리 읽어 sendmsg로 보내는 경로로
+        폴백합니다.
+
         [프로토콜 형식]
-        [8바이트: 데이터 길이][데이터 스트림...]
-        
+        [prefix][8바이트: 데이터 길이][데이터 스트림...]
+
         [매개변수]
         sock (socket.socket): 데이터를 보낼 소켓
-        file_path (Path): 읽을 파일 경로
         start (int): 읽기 시작 위치 (바이트 오프셋)
         end (int): 읽기 종료 위치 (바이트 오프셋, 미포함)
         worker_id (int): 워커 번호 (진행률 표시용)
-        
+        prefix (bytes): 길이 헤더 앞에 같은 sendmsg로 묶어 보낼 데이터
+            (예: 작업 JSON 프레임). 기본값은 빈 바이트
+
         [동작 순서]
-        1. 먼저 전송할 총 크기를 8바이트로 전송
-        2. 파일에서 블록 단위로 읽어서 소켓으로 전송
+        1. prefix + 총 크기(8바이트) + 첫 블록을 한 번에 전송
+        2. 파일에서 블록 단위로 읽어서 배치로 전송
         3. 주기적으로 진행률 업데이트
         """
         total = end - start  # 전송할 총 바이트 수
         if total < 0:
             raise ValueError("Invalid range")
 
-        # 8바이트 길이 정보 전송 ("!Q": unsigned long long)
-        sock.sendall(struct.pack(BIN_LEN_FMT, total))
-
-        # 파일 열기 ("rb": read binary, 바이너리 읽기 모드)
-        with open(file_path, "rb") as f:
-            # seek(): 파일 포인터를 특정 위치로 이동
-            f.seek(start)
-            
-            remaining = total  # 남은 전송량
-            sent = 0           # 전송 완료량
-            last_update = 0    # 마지막 진행률 업데이트 시간
-            
-            while remaining > 0:
-                # 읽을 크기 결정 (블록 크기와 남은 크기 중 작은 값)
-                to_read = min(self.stream_block_size, remaining)
-                
-                # 파일에서 데이터 읽기
-                chunk = f.read(to_read)
-                if not chunk:
+        # prefix + 8바이트 길이 정보 ("!Q": unsigned long long)
+        hdr = prefix + BIN_LEN_STRUCT.pack(total)
+
+        # 공유 이미지 fd 사용 (load_dd_image에서 한 번만 open)
+        # pread/sendfile은 오프셋을 명시하므로 파일 포인터가 없고,
+        # 여러 워커 스레드가 seek 없이 같은 fd를 동시에 써도 안전함
+        file_fd = self.image_fd
+        sock_fd = sock.fileno()
+
+        # 커널에 읽기 패턴 힌트 제공 (posix_fadvise)
+        # SEQUENTIAL: 이 구간을 순차로 읽을 것이므로 readahead 창을 확대
+        # WILLNEED: 곧 읽을 것이므로 미리 페이지 캐시에 적재 시작
+        # (advice는 비트마스크가 아니라 개별 값이므로 두 번 호출)
+        # 전송이 디스크 읽기를 기다리며 멈추는 구간이 줄어듦. 힌트일
+        # 뿐이므로 미지원 플랫폼에서는 조용히 넘어감
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(file_fd, start, total,
+                                 os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(file_fd, start, total,
+                                 os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+
+        # 첫 블록은 헤더와 함께 한 번의 sendmsg로 전송
+        # _pread: fd 위치 포인터를 건드리지 않고 지정 오프셋에서 읽기
+        # (pread 미지원 플랫폼에서는 락 보호 seek+read - 상단 참고)
+        first = _pread(file_fd, min(self.stream_block_size, total), start)
+        self._send_vec(sock, [hdr, first])
+
+        remaining = total - len(first)  # 남은 전송량
+        sent = len(first)               # 전송 완료량
+        last_update = 0    # 마지막 진행률 업데이트 시간
+
+        # 본문은 가능하면 sendfile로 커널 내부 전송
+        use_sendfile = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+        while remaining > 0:
+            if use_sendfile:
+                try:
+                    # os.sendfile(출력fd, 입력fd, 오프셋, 크기)
+                    # 오프셋 지정 호출은 파일 포인터를 건드리지 않음
+                    n = os.sendfile(sock_fd, file_fd, start + sent,
+                                    min(self.stream_block_size, remaining))
+                except OSError:
+                    # 일부 플랫폼/파일시스템은 sendfile 미지원
+                    # -> 이후 블록부터 pread + sendmsg 경로 사용
+                    use_sendfile = False
+                    continue
+                if n == 0:
                     raise IOError("Unexpected EOF while reading DD image")
-                
-                # 소켓으로 전송
-                sock.sendall(chunk)
-                
-                remaining -= len(chunk)
-                sent += len(chunk)
-                
-                # 진행률 업데이트 (0.3초마다 또는 완료 시)
-                now = time.time()
-                if now - last_update >= 0.3 or remaining == 0:
-                    self.progress_display.update(worker_id, sent, 'sending')
-                    last_update = now
+                remaining -= n
+                sent += n
+            else:
+                # 폴백: 블록을 여러 개 미리 읽어 한 번의 sendmsg로 전송
+                blocks = []
+                batch_size = 0
+                while remaining > batch_size and len(blocks) < self.SEND_BATCH_BLOCKS:
+                    chunk = _pread(file_fd,
+                                     min(self.stream_block_size,
+                                         remaining - batch_size),
+                                     start + sent + batch_size)
+                    if not chunk:
+                        raise IOError("Unexpected EOF while reading DD image")
+                    blocks.append(chunk)
+                    batch_size += len(chunk)
+
+                # 소켓으로 전송 (배치당 시스템 콜 1회)
+                self._send_vec(sock, blocks)
+
+                remaining -= batch_size
+                sent += batch_size
+
+            # 진행률 업데이트 (0.3초마다 또는 완료 시)
+            now = time.time()
+            if now - last_update >= 0.3 or remaining == 0:
+                self.progress_display.update(worker_id, sent, 'sending')
+                last_update = now
+
+    def _o_tmpfile_usable(self) -> bool:
+        """
+        결과 디렉토리에서 O_TMPFILE + link() 조합이 동작하는지 검사합니다.
+
+        [왜 실제로 해봐야 하는가?]
+        O_TMPFILE 상수가 있어도 파일시스템(overlayfs 등)이나 컨테이너
+        환경에 따라 익명 파일 생성 또는 /proc/self/fd 경유 link()가
+        EXDEV 등으로 실패할 수 있습니다. 시작 시점에 빈 파일로 한 번
+        전체 경로(열기 -> link -> unlink)를 시험해 보고 결과를 캐시하여,
+        실패 환경에서는 이름 있는 임시 파일 경로로 조용히 폴백합니다.
 
-    def recv_binary_stream_to_file(self, sock: socket.socket, out_path: Path) -> int:
+        [반환값]
+        bool: O_TMPFILE 경로 사용 가능 여부 (결과는 캐시됨)
         """
-        소켓에서 바이너리 데이터를 수신하여 파일로 저장합니다.
-        
+        if self._use_o_tmpfile is not None:
+            return self._use_o_tmpfile
+
+        ok = False
+        if O_TMPFILE:
+            probe = self.results_dir / f".o_tmpfile_probe_{os.getpid()}_{threading.get_ident()}"
+            try:
+                fd = os.open(str(self.results_dir), O_TMPFILE | os.O_WRONLY, 0o644)
+                try:
+                    os.link(f"/proc/self/fd/{fd}", probe, follow_symlinks=True)
+                    probe.unlink()
+                    ok = True
+                finally:
+                    os.close(fd)
+            except OSError:
+                ok = False
+
+        self._use_o_tmpfile = ok
+        return ok
+
+    def recv_binary_stream_to_tmpfile(self, sock: socket.socket, worker_id: int, offset: int):
+        """
+        소켓에서 바이너리 데이터를 수신하여 임시 파일로 저장합니다.
+        수신하면서 중복 검사용 해시를 같이 계산합니다.
+
+        [해시를 수신 중에 계산하는 이유]
+        파일을 다 받은 뒤 다시 열어서 해시를 계산하면 방금 쓴 데이터를
+        한 번 더 읽게 됩니다(파일당 디스크 트래픽 2배). 수신 루프 안에서
+        도착한 블록을 바로 h.update()에 넣으면 재읽기가 완전히 사라지고,
+        해시 계산이 네트워크 수신 대기 시간에 겹쳐집니다.
+
+        [O_TMPFILE - 이름 없는 임시 파일]
+        가능하면 결과 디렉토리에 익명 파일(O_TMPFILE)을 만들어 씁니다.
+        중복으로 판명되면 fd를 닫는 것만으로 커널이 공간을 회수하고,
+        고유 파일이면 /proc/self/fd/N을 link()해서 최종 이름을 답니다.
+        미지원 환경에서는 이름 있는 임시 파일로 폴백합니다 (tmp_path 반환).
+
         [프로토콜 형식]
         [8바이트: 데이터 길이][데이터 스트림...]
-        
+
         [매개변수]
         sock (socket.socket): 데이터를 받을 소켓
-        out_path (Path): 저장할 파일 경로
-        
+        worker_id (int): 워커 번호 (폴백 임시 파일명에 사용)
+        offset (int): 파일의 이미지 내 오프셋 (폴백 임시 파일명에 사용)
+
         [반환값]
-        int: 수신한 총 바이트 수 (실패 시 -1)
-        
-        [동작 순서]
-        1. 8바이트 길이 정보 수신
-        2. 길이만큼 데이터를 수신하면서 파일에 기록
+        (total, fd, tmp_path, digest) 튜플:
+        - total (int): 수신한 총 바이트 수 (실패 시 -1)
+        - fd (int): 데이터가 담긴 파일 디스크립터 (실패 시 -1)
+        - tmp_path (Path): 폴백 경로의 임시 파일 (O_TMPFILE 성공 시 None)
+        - digest (str): 수신 데이터의 해시 16진수 문자열 (실패 시 None)
+
+        호출자는 fd를 반드시 os.close()해야 합니다.
         """
         # 길이 정보 수신
         size_b = self._recv_exact(sock, BIN_LEN_SIZE)
         if not size_b:
-            return -1
-        total = struct.unpack(BIN_LEN_FMT, size_b)[0]
+            return -1, -1, None, None
+        total = BIN_LEN_STRUCT.unpack(size_b)[0]
 
         remaining = total
-        
-        # 부모 디렉토리가 없으면 생성
-        # parents=True: 중간 디렉토리도 모두 생성
-        out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 파일에 기록 ("wb": write binary)
-        with open(out_path, "wb") as f:
+        # 익명 임시 파일 열기 (디렉토리를 O_TMPFILE로 열면 이름 없는 파일 생성)
+        fd = -1
+        tmp_path = None
+        if self._o_tmpfile_usable():
+            try:
+                fd = os.open(str(self.results_dir), O_TMPFILE | os.O_WRONLY, 0o644)
+            except OSError:
+                fd = -1  # 파일시스템이 O_TMPFILE 미지원 - 폴백
+        if fd < 0:
+            # 폴백: 이름 있는 임시 파일 (호출자가 replace/unlink로 정리)
+            tmp_path = self.results_dir / f"__tmp_worker{worker_id}_off{offset}.jpg"
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        # 최종 크기를 미리 할당 (크기는 8바이트 헤더로 이미 알고 있음)
+        # 블록마다 파일을 늘리면 extent 추가 등 메타데이터 갱신이 반복되고
+        # 단편화가 생길 수 있음. fallocate로 연속 공간을 한 번에 확보
+        # (미지원 파일시스템/플랫폼에서는 조용히 넘어감 - 정확성 무관)
+        if total > 0:
+            try:
+                os.posix_fallocate(fd, 0, total)
+            except (AttributeError, OSError):
+                pass
+
+        # 해시 객체 생성 (blake3 또는 sha256 - 상단 new_dedupe_hash 참고)
+        h = new_dedupe_hash()
+
+        # 스레드별 재사용 버퍼에 recv_into로 직접 수신
+        # (recv()의 호출당 bytes 할당 제거)
+        mv = memoryview(self._recv_buffer())
+
+        try:
             while remaining > 0:
-                # 소켓에서 데이터 수신
-                chunk = sock.recv(min(65536, remaining))
-                if not chunk:
+                # 소켓에서 데이터 수신 (버퍼 크기와 남은 크기 중 작은 값)
+                got = sock.recv_into(mv[:min(len(mv), remaining)])
+                if got == 0:
                     raise IOError("Socket closed while receiving binary")
-                
-                # 파일에 기록
-                f.write(chunk)
-                remaining -= len(chunk)
+
+                # 파일 기록 + 해시 갱신 (재읽기/복사 없음)
+                os.write(fd, mv[:got])
+                h.update(mv[:got])
+                remaining -= got
+        except Exception:
+            # 수신 실패: fd를 닫고 (익명 파일은 이것만으로 사라짐)
+            # 폴백 임시 파일은 지운 뒤 예외를 다시 던짐
+            os.close(fd)
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+        return total, fd, tmp_path, h.hexdigest()
+
+    def recv_binary_stream_to_memory(self, sock: socket.socket):
+        """
+        소켓에서 바이너리 데이터를 수신하여 메모리에 담습니다.
+        (작은 복구 파일 전용 - RESULT_MEMORY_MAX 이하)
+
+        [왜 메모리로 받는가?]
+        임시 파일에 쓰고 중복 검사 후 rename/unlink하는 경로는 파일당
+        파일시스템 메타데이터 연산이 서너 번입니다. 작은 파일을 메모리로
+        받으면 중복 검사를 디스크에 닿기 전에 끝낼 수 있어, 중복 파일은
+        아예 기록되지 않고 고유 파일은 최종 경로에 쓰기 한 번이면 됩니다.
+
+        [매개변수]
+        sock (socket.socket): 데이터를 받을 소켓
+
+        [반환값]
+        (total, data, digest) 튜플:
+        - total (int): 수신한 총 바이트 수 (실패 시 -1)
+        - data (bytes): 수신한 데이터 (실패 시 None)
+        - digest (str): 데이터의 해시 16진수 문자열 (실패 시 None)
+        """
+        # 길이 정보 수신
+        size_b = self._recv_exact(sock, BIN_LEN_SIZE)
+        if not size_b:
+            return -1, None, None
+        total = BIN_LEN_STRUCT.unpack(size_b)[0]
+
+        # 본문 수신
+        data = self._recv_exact(sock, total)
+        if total > 0 and not data:
+            raise IOError("Socket closed while receiving binary")
+
+        # 해시 계산 (데이터가 통째로 있으므로 한 번의 update)
+        return total, data, new_dedupe_hash(data).hexdigest()
+
+    def _drain_binary_stream(self, sock: socket.socket) -> int:
+        """
+        바이너리 스트림 하나를 수신만 하고 버립니다.
+
+        [왜 버리면서도 받아야 하는가?]
+        (오프셋, 크기)가 이미 처리한 파일과 일치하면 내용은 확실한
+        중복이지만, 워커는 이미 본문을 push 방식으로 보내는 중입니다.
+        프레이밍을 유지하려면 본문 바이트를 소켓에서 꺼내긴 해야 하며,
+        대신 해시 계산도 디스크 쓰기도 하지 않고 재사용 버퍼에 덮어쓰기만
+        합니다. 중복 판정에 드는 비용이 순수 수신 비용까지 내려갑니다.
+
+        [매개변수]
+        sock (socket.socket): 데이터를 받을 소켓
+
+        [반환값]
+        int: 버린 바이트 수 (실패 시 -1)
+        """
+        size_b = self._recv_exact(sock, BIN_LEN_SIZE)
+        if not size_b:
+            return -1
+        total = BIN_LEN_STRUCT.unpack(size_b)[0]
+
+        remaining = total
+        mv = memoryview(self._recv_buffer())
+        while remaining > 0:
+            got = sock.recv_into(mv[:min(len(mv), remaining)])
+            if got == 0:
+                raise IOError("Socket closed while draining binary")
+            remaining -= got
 
         return total
 
@@ -784,15 +1252,31 @@ class FileCarvingMaster:
         # SOL_SOCKET: 소켓 레벨 옵션
         # SO_REUSEADDR: 주소 재사용 허용 (1 = 활성화)
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
+
+        # SO_REUSEPORT: 같은 포트에 여러 리스너 바인딩 허용 (Linux/BSD)
+        # 커널이 수락을 리스너들에 분산해주므로, 워커 수가 많아져
+        # 수락 루프를 여러 스레드로 확장할 때 그대로 활용 가능
+        # (미지원 플랫폼에서는 조용히 넘어감)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                server_socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+
+
         # 바인딩: 소켓을 특정 IP와 포트에 연결
         # "0.0.0.0": 모든 네트워크 인터페이스에서 연결 수락
         # "127.0.0.1": localhost만 (외부 연결 불가)
         server_socket.bind(("0.0.0.0", self.port))
         
         # 연결 대기 시작
-        # 10: 대기 큐의 최대 크기 (동시에 대기 가능한 연결 수)
-        server_socket.listen(10)
+        # 128: 대기 큐(backlog)의 최대 크기
+        # 워커 수십 대가 거의 동시에 connect()하면 backlog가 작을 때
+        # SYN이 드롭되어 재시도 지연(1초+)이 생길 수 있음. backlog는
+        # 수락 전 대기 슬롯일 뿐이라 크게 잡아도 비용이 없음
+        # (커널의 net.core.somaxconn보다 크면 그 값으로 잘림)
+        server_socket.listen(128)
 
         print(f"\n[마스터] 서버 시작 - 포트: {self.port}")
         print(f"[마스터] 다른 PC에서 연결하려면: python file_carving_worker.py <이 PC의 IP> {self.port}")
@@ -808,7 +1292,22 @@ class FileCarvingMaster:
                     # 반환값: (클라이언트 소켓, (IP, 포트) 튜플)
                     client_socket, addr = server_socket.accept()
                     print(f"[마스터] 워커 연결됨: {addr}")
-                    
+
+                    # ---- 연결별 소켓 성능 튜닝 ----
+                    # TCP_NODELAY: Nagle 알고리즘 비활성화
+                    # 작은 JSON 제어 메시지가 병합 대기로 지연되지 않도록 함
+                    # (헤더+본문은 sendmsg로 이미 한 세그먼트로 묶여 나가므로
+                    #  TCP_CORK까지 쓸 필요는 없음)
+                    client_socket.setsockopt(
+                        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+                    # 송수신 버퍼를 16MB로 확대 (SOCKET_BUF_SIZE 참고)
+                    client_socket.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUF_SIZE)
+                    client_socket.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUF_SIZE)
+
+
                     # 워커로부터 정보 수신 (워커 ID, 호스트명 등)
                     info = self.recv_json(client_socket)
                     print(f"[마스터] 워커 정보: {info}")
@@ -841,36 +1340,67 @@ class FileCarvingMaster:
         # 결과 요약 출력
         self.print_summary()
 
-    def process_worker(self, worker_id: int, worker: dict, task: dict, 
-                       read_start: int, read_end: int) -> dict:
+    def _next_task(self, worker_id: int):
+        """
+        워커가 처리할 다음 작업을 가져옵니다.
+
+        [동작]
+        1. 자기 큐에서 pop (평상시 경로 - 다른 워커와 락 경쟁 없음)
+        2. 자기 큐가 비었으면 다른 워커의 큐에서 가져옴 (work stealing)
+           느린 워커에게 몰린 작업을 먼저 끝난 워커가 가져가므로
+           전체 완료 시간이 가장 느린 워커 하나에 묶이지 않습니다.
+
+        [매개변수]
+        worker_id (int): 작업을 요청하는 워커 번호
+
+        [반환값]
+        dict: 작업 정보 (남은 작업이 없으면 None)
+        """
+        # 1) 자기 큐에서 pop
+        # 락은 워커별로 분할되어 있어 steal이 없는 한 경쟁이 없음
+        with self.task_locks[worker_id]:
+            if self.worker_tasks[worker_id]:
+                return self.worker_tasks[worker_id].popleft()
+
+        # 2) 다른 워커의 큐에서 steal (뒤에서 꺼내 소유자와 반대 방향)
+        for i in range(len(self.worker_tasks)):
+            if i == worker_id:
+                continue
+            with self.task_locks[i]:
+                if self.worker_tasks[i]:
+                    return self.worker_tasks[i].pop()
+
+        return None  # 남은 작업 없음
+
+    def process_worker(self, worker_id: int, worker: dict) -> dict:
         """
         개별 워커와의 통신을 처리합니다 (별도 스레드에서 실행).
-        
-        [동작 순서]
+        자기 작업 큐가 빌 때까지 작업을 하나씩 가져와 처리합니다.
+
+        [작업당 동작 순서]
         1. 작업 정보(task) JSON 전송
         2. 청크 데이터 스트리밍 전송
         3. 워커의 카빙 완료 대기
         4. 복구된 파일들 수신
-        
+
+        작업이 더 없으면 소켓을 닫습니다. 워커는 연결이 닫히면
+        "남은 작업 없음"으로 보고 종료합니다 (워커의 run() 루프 참고).
+
         [매개변수]
         worker_id (int): 워커 번호 (0부터 시작)
         worker (dict): 워커 정보 (소켓, 주소 등)
-        task (dict): 작업 정보 (오프셋, 크기 등)
-        read_start (int): 읽기 시작 오프셋
-        read_end (int): 읽기 종료 오프셋
-        
+
         [반환값]
         dict: 처리 결과 정보
             - worker_id: 워커 번호
             - address: 워커 IP
             - success: 성공 여부
-            - recovered_count: 복구된 파일 수
+            - recovered_count: 복구된 파일 수 (전체 작업 합계)
             - error: 에러 메시지 (있는 경우)
         """
         sock = worker["socket"]
         addr = worker["address"][0]  # IP 주소만 추출
-        chunk_size = read_end - read_start
-        
+
         # 결과 정보 초기화
         result_info = {
             "worker_id": worker_id,
@@ -880,40 +1410,108 @@ class FileCarvingMaster:
             "error": None
         }
 
+        # 송신 스레드 -> 수신부로 "보낸 작업"을 순서대로 전달하는 큐
+        # (TCP는 순서를 보존하므로 결과도 보낸 순서대로 도착함)
+        sent_tasks = queue.Queue()
+
+        # 크레딧 세마포어: 동시 진행 작업 수를 MAX_INFLIGHT_TASKS로 제한
+        # 송신 전에 acquire, 해당 작업의 결과를 다 받으면 release
+        credit = threading.BoundedSemaphore(self.MAX_INFLIGHT_TASKS)
+
+        # 송신 스레드에서 발생한 예외를 본 스레드로 전달할 공간
+        send_errors = []
+
+        def send_tasks():
+            """송신 담당: 작업을 하나씩 꺼내 task JSON + 청크를 전송합니다."""
+            try:
+                while True:
+                    # 크레딧 획득 (in-flight 작업이 상한이면 결과 수신까지 대기)
+                    credit.acquire()
+
+                    task = self._next_task(worker_id)
+                    if task is None:
+                        break  # 모든 큐가 빔 - 이 워커는 끝
+
+                    read_start = task["read_start"]
+                    read_end = task["read_end"]
+
+                    # 진행률 표시를 위한 워커 정보 설정 (작업마다 초기화)
+                    self.progress_display.set_worker_info(
+                        worker_id, addr, read_end - read_start)
+
+                    # 작업 정보(task) JSON과 청크 데이터 스트리밍 전송
+                    # task 프레임을 prefix로 넘기면 [task JSON][청크 길이][첫 블록]이
+                    # 하나의 sendmsg로 나감 (작은 제어 메시지의 별도 세그먼트 방지)
+                    self.send_binary_stream_with_progress(
+                        sock, read_start, read_end, worker_id,
+                        prefix=self._encode_json_frame(task)
+                    )
+
+                    # 수신부에 "이 작업의 결과가 올 것"이라고 알림
+                    sent_tasks.put(task)
+            except Exception as e:
+                send_errors.append(e)
+            finally:
+                # 종료 신호 (None) 전달
+                sent_tasks.put(None)
+                # 마스터 -> 워커 방향만 닫음 (FIN 전송)
+                # 워커는 다음 작업을 읽으려다 EOF를 만나 "작업 끝"으로 인식하고,
+                # 워커 -> 마스터 방향은 살아 있어 남은 결과는 계속 수신됨
+                try:
+                    sock.shutdown(socket.SHUT_WR)
+                except OSError:
+                    pass  # 이미 닫혀있어도 무시
+
+        # 송신을 별도 스레드로 분리 (전송과 결과 수신의 파이프라이닝)
+        # 같은 스레드에서 보내고 받으면 "작업 N 결과를 다 받은 뒤에야
+        # 작업 N+1 전송 시작"이라 네트워크가 카빙 동안 놀게 됨.
+        # TCP는 전이중(full-duplex)이므로 한 소켓에서 송신 스레드와
+        # 수신 스레드가 동시에 동작해도 안전함
+        sender = threading.Thread(target=send_tasks, daemon=True)
+        sender.start()
+
         try:
-            # 진행률 표시를 위한 워커 정보 설정
-            self.progress_display.set_worker_info(worker_id, addr, chunk_size)
-            
-            # 1) 작업 정보(task) JSON 전송
-            self.send_json(sock, task)
-            
-            # 2) 청크 데이터 스트리밍 전송 (진행률 표시)
-            self.send_binary_stream_with_progress(
-                sock, self.dd_image_path, read_start, read_end, worker_id
-            )
-            
-            # 3) 카빙 진행 중 상태로 변경
-            self.progress_display.set_phase(worker_id, 'carving', '')
+            while True:
+                task = sent_tasks.get()
+                if task is None:
+                    break  # 송신 스레드가 모든 작업을 보냄
+
+                # 카빙 진행 중 상태로 변경
+                self.progress_display.set_phase(worker_id, 'carving', '')
+
+                # 이 작업의 결과 수신 (워커는 작업을 순서대로 처리함)
+                result_info["recovered_count"] += self.receive_results(sock, worker_id)
+
+                # 크레딧 반환 -> 송신 스레드가 다음 작업을 보낼 수 있음
+                credit.release()
+
+            sender.join()
+            if send_errors:
+                raise send_errors[0]  # 송신 쪽 예외를 여기서 보고
 
-            # 4) 결과 수신
-            recovered_count = self.receive_results(sock, worker_id)
-            
             result_info["success"] = True
-            result_info["recovered_count"] = recovered_count
-            self.progress_display.set_phase(worker_id, 'done', f'{recovered_count}개 파일 복구')
+            self.progress_display.set_phase(
+                worker_id, 'done', f'{result_info["recovered_count"]}개 파일 복구')
 
         except Exception as e:
             # 예외 발생 시 에러 정보 저장
             result_info["error"] = str(e)
             self.progress_display.set_phase(worker_id, 'error', str(e)[:30])
-            
+            # 수신 실패로 반환하지 못한 크레딧을 돌려줘 송신 스레드의
+            # acquire() 블록을 풀어줌 (소켓이 닫히면 송신도 곧 실패로 종료)
+            try:
+                credit.release()
+            except ValueError:
+                pass  # 상한 초과 release는 무시 (BoundedSemaphore)
+
         finally:
             # finally: 예외 발생 여부와 관계없이 항상 실행
-            # 소켓 닫기
+            # 소켓 닫기 (송신 스레드가 블로킹 중이어도 여기서 풀림)
             try:
                 sock.close()
             except Exception:
                 pass  # 이미 닫혀있어도 무시
+            sender.join(timeout=5)
 
         return result_info
 
@@ -945,34 +1543,46 @@ class FileCarvingMaster:
             return
 
         n = len(self.workers)  # 워커 수
-        base = self.image_size // n  # 기본 청크 크기 (정수 나눗셈)
+        base = self.image_size // n  # 워커당 담당분 (정수 나눗셈)
+
+        # 작업 분할 크기 결정
+        # 워커당 1개의 큰 작업 대신, 담당분의 1/4 크기로 잘게 나눕니다.
+        # 작업이 여러 개면 빨리 끝난 워커가 남의 작업을 steal해서
+        # 디스크/CPU 속도 차이로 인한 "마지막 워커 대기"를 줄일 수 있습니다.
+        # 너무 잘게 나누면 작업당 왕복 비용이 커지므로 TASK_SIZE_MIN으로 하한을 둡니다.
+        if self.task_size > 0:
+            task_size = self.task_size  # 사용자 지정 크기
+        else:
+            task_size = max(base // 4, TASK_SIZE_MIN)  # 자동 결정
+        task_size = min(task_size, self.image_size)  # 이미지보다 클 수 없음
 
         print("[마스터] 병렬 작업 분배 시작")
         print(f"  - 전체 크기: {format_size(self.image_size)}")
         print(f"  - 워커 수: {n}")
-        print(f"  - 청크 크기: ~{format_size(base)}")
+        print(f"  - 작업 크기: ~{format_size(task_size)}")
         print(f"  - 오버랩: {format_size(self.overlap_size)}")
         print()
 
-        # 각 워커별 작업 정보 준비
-        tasks_args = []  # (worker_id, worker, task, read_start, read_end) 튜플 리스트
-        
-        for i, w in enumerate(self.workers):
+        # 워커별 작업 큐 준비 (자기 큐만 만지므로 평상시 락 경쟁 없음)
+        self.worker_tasks = [deque() for _ in range(n)]
+        self.task_locks = [threading.Lock() for _ in range(n)]
+
+        task_id = 0
+        for start_offset in range(0, self.image_size, task_size):
             # 담당 영역 계산 (실제 책임지는 범위)
-            start_offset = i * base
-            # 마지막 워커는 끝까지 담당 (나머지 처리)
-            end_offset = (i + 1) * base if i < n - 1 else self.image_size
+            # 마지막 작업은 이미지 끝까지 담당 (나머지 처리)
+            end_offset = min(start_offset + task_size, self.image_size)
 
             # 읽기 영역 계산 (오버랩 포함)
-            # 첫 번째 워커는 앞쪽 오버랩 없음
-            read_start = 0 if i == 0 else max(0, start_offset - self.overlap_size // 2)
-            # 마지막 워커는 뒤쪽 오버랩 없음
-            read_end = self.image_size if i == n - 1 else min(self.image_size, end_offset + self.overlap_size // 2)
+            # 첫 번째 작업은 앞쪽 오버랩 없음
+            read_start = 0 if start_offset == 0 else max(0, start_offset - self.overlap_size // 2)
+            # 마지막 작업은 뒤쪽 오버랩 없음
+            read_end = self.image_size if end_offset == self.image_size else min(self.image_size, end_offset + self.overlap_size // 2)
             chunk_size = read_end - read_start
 
             # 작업 정보 딕셔너리
             task = {
-                "task_id": i,
+                "task_id": task_id,
                 "start_offset": start_offset,  # 담당 시작
                 "end_offset": end_offset,      # 담당 끝
                 "read_start": read_start,      # 실제 읽기 시작 (오버랩 포함)
@@ -980,7 +1590,12 @@ class FileCarvingMaster:
                 "chunk_size": chunk_size,
                 "overlap_size": self.overlap_size,
             }
-            tasks_args.append((i, w, task, read_start, read_end))
+            # 라운드 로빈으로 워커 전용 큐에 적재
+            # (이미지 앞부분부터 워커들에게 고르게 분산됨)
+            self.worker_tasks[task_id % n].append(task)
+            task_id += 1
+
+        print(f"  - 총 작업 수: {task_id}개")
 
         # 진행률 디스플레이 초기화
         self.progress_display = MultiProgressDisplay(n)
@@ -1000,12 +1615,12 @@ class FileCarvingMaster:
         with ThreadPoolExecutor(max_workers=n) as executor:
             # submit()으로 각 워커 처리 작업 제출
             # futures 딕셔너리: {Future 객체: worker_id}
+            # 각 워커 스레드는 자기 작업 큐가 빌 때까지 작업을 반복 처리
             futures = {
-                executor.submit(self.process_worker, *args): args[0]
-                for args in tasks_args
+                executor.submit(self.process_worker, i, w): i
+                for i, w in enumerate(self.workers)
             }
-            # *args: 튜플 언패킹 (i, w, task, read_start, read_end)
-            
+
             # as_completed(): 완료된 순서대로 Future 반환
             for future in as_completed(futures):
                 worker_id = futures[future]
@@ -1034,10 +1649,13 @@ class FileCarvingMaster:
            - 파일 메타데이터 JSON 수신: {"offset": ..., "size": ...}
            - 파일 데이터 바이너리 수신
         
-        [중복 제거]
-        MD5 해시를 계산하여 이미 받은 파일인지 확인합니다.
+        [중복 제거 - 2단계]
         오버랩 영역으로 인해 같은 파일이 여러 워커에서 발견될 수 있습니다.
-        
+        1. (오프셋, 크기) 사전 필터: 이미 처리한 쌍과 일치하면 이미지의
+           같은 바이트 구간이므로 해시/디스크 없이 본문만 버립니다.
+        2. 해시 검사: 사전 필터를 통과한 파일은 수신 중 계산한 해시
+           (blake3 또는 sha256)로 내용 기준 중복을 확인합니다.
+
         [매개변수]
         sock (socket.socket): 워커와 연결된 소켓
         worker_id (int): 워커 번호
@@ -1062,60 +1680,97 @@ class FileCarvingMaster:
                 break
 
             offset = int(meta.get("offset", -1))
+            size = int(meta.get("size", 0))
 
-            # 임시 파일로 저장
-            tmp_path = self.results_dir / f"__tmp_worker{worker_id}_off{offset}.jpg"
-            received = self.recv_binary_stream_to_file(sock, tmp_path)
+            # (오프셋, 크기) 사전 필터
+            # 같은 절대 오프셋에서 같은 크기로 카빙된 파일은 이미지의
+            # 같은 바이트 구간이므로 확실한 중복 - 해시/디스크를 건너뛰고
+            # 본문만 읽어서 버림 (프레이밍 유지를 위해 수신은 필요)
+            with self.lock:
+                known = (offset, size) in self.offset_sizes
+            if known:
+                self._drain_binary_stream(sock)
+                self.progress_display.set_phase(
+                    worker_id, 'receiving', f'{i+1}/{recovered_count}')
+                continue
+
+            if size <= RESULT_MEMORY_MAX:
+                # 작은 파일: 메모리로 수신
+                # 중복 검사를 디스크에 닿기 전에 끝낼 수 있음
+                fd = -1
+                tmp_path = None
+                received, data, file_hash = self.recv_binary_stream_to_memory(sock)
+            else:
+                # 큰 파일: 익명 임시 파일(O_TMPFILE)로 스트리밍 수신
+                # (수신하면서 해시도 같이 계산됨)
+                data = None
+                received, fd, tmp_path, file_hash = \
+                    self.recv_binary_stream_to_tmpfile(sock, worker_id, offset)
 
             # 진행률 업데이트
             self.progress_display.set_phase(worker_id, 'receiving', f'{i+1}/{recovered_count}')
 
             if received <= 0:
-                # 수신 실패 시 임시 파일 삭제
-                try:
-                    # unlink(): 파일 삭제
-                    # missing_ok=True: 파일이 없어도 에러 발생하지 않음
-                    tmp_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
+                # 수신 실패 (길이 헤더조차 못 받은 경우 - fd는 열리지 않았음)
                 continue
 
-            # MD5 해시 계산 (중복 검사용)
-            # hashlib.md5(): MD5 해시 객체 생성
-            md5 = hashlib.md5()
-            with open(tmp_path, "rb") as rf:
-                # iter(함수, 종료값): 함수를 반복 호출하여 종료값이 나올 때까지 반복
-                # lambda: rf.read(1024*1024): 1MB씩 읽는 익명 함수
-                # b"": 빈 바이트가 나오면 종료 (파일 끝)
-                for chunk in iter(lambda: rf.read(1024 * 1024), b""):
-                    # update(): 해시에 데이터 추가
-                    md5.update(chunk)
-            # hexdigest(): 16진수 문자열로 해시값 반환
-            file_hash = md5.hexdigest()
-
-            # 락을 사용하여 공유 자원 보호
+            # 중복 판정만 락 안에서 수행 (집합 조회/추가 - 나노초 단위)
+            # 판정과 동시에 해시를 '선점'하므로, 같은 해시가 다른 스레드에서
+            # 동시에 와도 한쪽만 고유 판정을 받음. 디스크 쓰기는 락 밖에서
+            # 수행해 워커 스레드 간 I/O 직렬화를 없앰
             with self.lock:
-                # 중복 검사
-                if file_hash in self.file_hashes:
-                    # 중복 파일 삭제
+                # 이 (오프셋, 크기)는 처리 완료 - 이후 도착분은 사전 필터에서 걸러짐
+                self.offset_sizes.add((offset, received))
+
+                is_dup = file_hash in self.file_hashes
+                if not is_dup:
+                    self.file_hashes.add(file_hash)  # 해시 선점
+
+            if is_dup:
+                # 중복 파일 정리
+                # - 메모리로 받았다면 디스크에 닿은 적 없음
+                # - 익명 파일(O_TMPFILE)은 close만으로 커널이 회수
+                # - 폴백 임시 파일만 unlink 필요
+                if fd >= 0:
+                    os.close(fd)
+                if tmp_path is not None:
                     try:
                         tmp_path.unlink(missing_ok=True)
                     except Exception:
                         pass
-                    continue
+                continue
+
+            # ---- 여기부터는 락 없이 진행 (파일명이 오프셋+해시라 스레드 간 충돌 없음) ----
 
-                # 해시 집합에 추가
-                self.file_hashes.add(file_hash)
+            # 최종 파일명 생성
+            # 오프셋과 해시 앞 8자리를 포함하여 고유한 이름 생성
+            final_name = f"recovered_{offset}_{file_hash[:8]}.jpg"
+            final_path = self.results_dir / final_name
 
-                # 최종 파일명 생성
-                # 오프셋과 해시 앞 8자리를 포함하여 고유한 이름 생성
-                final_name = f"recovered_{offset}_{file_hash[:8]}.jpg"
-                final_path = self.results_dir / final_name
-                
-                # replace(): 파일 이동 (임시 파일 -> 최종 파일)
+            if data is not None:
+                # 고유 파일로 확정된 뒤에만 최종 경로에 쓰기 1회
+                final_path.write_bytes(data)
+            elif tmp_path is None:
+                # 익명 파일에 이름 달기: /proc/self/fd/N을 link()하면
+                # linkat(AT_SYMLINK_FOLLOW)으로 그 순간 파일이 생김
+                # (rename 없음, 중간 상태로 보이는 파일 없음)
+                try:
+                    os.link(f"/proc/self/fd/{fd}", final_path,
+                            follow_symlinks=True)
+                except FileExistsError:
+                    # 이전 실행의 잔재가 같은 이름으로 존재하는 경우
+                    final_path.unlink()
+                    os.link(f"/proc/self/fd/{fd}", final_path,
+                            follow_symlinks=True)
+                finally:
+                    os.close(fd)
+            else:
+                # 폴백 경로: replace()로 파일 이동 (임시 -> 최종)
+                os.close(fd)
                 tmp_path.replace(final_path)
 
-                # 복구된 파일 정보 저장
+            # 복구된 파일 정보 저장 (리스트 append만 락으로 보호)
+            with self.lock:
                 self.recovered_files.append({
                     "filename": final_name,
                     "size": received,
@@ -1210,6 +1865,8 @@ def main():
                         help="스트리밍 블록 크기(MB), 기본 4MB")
     parser.add_argument("--output", "-O", type=str, default="recovered_files",
                         help="출력 디렉토리 (기본값: recovered_files)")
+    parser.add_argument("--task", "-t", type=int, default=0,
+                        help="작업 분할 크기(MB), 0 = 자동 (워커 담당분의 1/4)")
     
     # parse_args(): 명령줄 인자 파싱
     # 반환값: 인자들이 속성으로 저장된 Namespace 객체
@@ -1221,6 +1878,7 @@ def main():
         port=args.port,
         overlap_size=args.overlap * 1024 * 1024,
         stream_block_size=args.block * 1024 * 1024,
+        task_size=args.task * 1024 * 1024,
     )
     
     # 출력 디렉토리 설정
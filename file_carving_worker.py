@@ -48,6 +48,14 @@ import tempfile        # 임시 파일/디렉토리 생성 라이브러리
 
 import time            # 시간 관련 함수 (현재 시간, 경과 시간 계산 등)
 
+import os              # 운영체제 관련 기능
+                       # os.open/os.write: 파일 디스크립터 기반 저수준 I/O
+                       # (버퍼링 없이 수신 버퍼를 그대로 디스크에 기록할 때 사용)
+
+import mmap            # 메모리 맵 파일 (memory-mapped file)
+                       # 파일 전체를 하나의 주소 공간처럼 다룰 수 있어
+                       # 블록 단위 read()와 이월(carry) 복사 없이 검색 가능
+
 import sys             # 시스템 관련 기능
                        # sys.stdout: 표준 출력 스트림 (진행률 표시에 사용)
                        # sys.stdout.flush(): 버퍼를 즉시 출력
@@ -55,6 +63,14 @@ import sys             # 시스템 관련 기능
 from pathlib import Path  # 파일 경로를 객체지향적으로 다루는 클래스
                           # 문자열보다 안전하고 편리한 경로 처리 가능
 
+import threading       # 스레드 관련 기능
+                       # 진행률 표시를 별도 데몬 스레드에서 수행할 때 사용
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+# ProcessPoolExecutor: 프로세스 풀 - GIL의 영향을 받지 않는 병렬 처리
+#   카빙(CPU 바운드)을 여러 코어에 나눠서 수행할 때 사용
+# as_completed: 완료된 순서대로 결과를 받아옴
+
 
 # ============================================================================
 # 상수 정의 (Constants)
@@ -75,6 +91,181 @@ JSON_LEN_SIZE = 4        # 길이 필드 크기: 4바이트
 BIN_LEN_FMT = "!Q"       # 8바이트 부호 없는 정수 형식
 BIN_LEN_SIZE = 8         # 길이 필드 크기: 8바이트
 
+# 미리 컴파일된 Struct 객체
+# struct.pack/unpack은 호출마다 포맷 문자열을 파싱하지만,
+# Struct 객체는 파싱을 한 번만 하고 pack/unpack 메서드를 재사용함
+# (복구 파일 수천 건의 메타 프레임을 만들 때 상수 비용 절감)
+JSON_LEN_STRUCT = struct.Struct(JSON_LEN_FMT)
+BIN_LEN_STRUCT = struct.Struct(BIN_LEN_FMT)
+
+# JSON 직렬화 함수
+# orjson이 설치되어 있으면 사용 (Rust 구현 - bytes를 직접 입출력하므로
+# UTF-8 인코딩/디코딩 단계가 사라지고 파싱도 수 배 빠름), 없으면
+# 표준 json으로 폴백. 선택 의존성이라 없어도 동작합니다 (마스터와 동일).
+try:
+    from orjson import dumps as json_dumps_bytes   # dict -> bytes
+    from orjson import loads as json_loads_bytes   # bytes -> dict
+except ImportError:
+    def json_dumps_bytes(obj):
+        # separators: 구분자 뒤 공백 제거 (orjson과 같은 압축 형식)
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_loads_bytes(payload):
+        return json.loads(payload.decode("utf-8"))
+
+# 소켓 송수신 버퍼 크기 (16MB)
+# 대역폭-지연 곱(BDP)을 채울 수 있도록 커널 기본값보다 크게 설정
+SOCKET_BUF_SIZE = 16 * 1024 * 1024
+
+# MSG_ZEROCOPY 전송을 시도할 최소 크기 (16KB)
+# 커널의 zero-copy 송신은 페이지 고정(pin) 비용이 있어
+# 약 10KB 이상의 큰 전송에서만 이득이 있음
+ZEROCOPY_MIN_SIZE = 16 * 1024
+
+# Linux 소켓 상수 (Python socket 모듈에 없는 버전 대비)
+# SO_ZEROCOPY: 소켓에서 zero-copy 송신 허용 (setsockopt)
+# MSG_ZEROCOPY: send() 호출 시 zero-copy 요청 플래그
+SO_ZEROCOPY = getattr(socket, "SO_ZEROCOPY", 60)
+MSG_ZEROCOPY = getattr(socket, "MSG_ZEROCOPY", 0x4000000)
+
+# 플랫폼별 시스템 콜 지원 여부
+# sendmsg(vectored I/O)와 pread는 Windows의 Python에 없으므로,
+# 미지원 플랫폼에서는 기능이 같은 폴백(버퍼별 sendall / seek+read)을
+# 사용합니다. 속도만 다르고 동작과 와이어 형식은 동일합니다.
+HAVE_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+if hasattr(os, "pread"):
+    _pread = os.pread
+else:
+    # Windows 폴백: lseek+read는 fd의 파일 포지션을 공유하므로
+    # 여러 스레드가 같은 fd를 쓸 때를 대비해 락으로 직렬화
+    _pread_lock = threading.Lock()
+
+    def _pread(fd, n, offset):
+        with _pread_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, n)
+
+# JPEG 시그니처
+# b"..." : 바이트 리터럴 (문자열이 아닌 바이트 시퀀스)
+SOI = b"\xff\xd8"  # Start Of Image - JPEG 시작
+EOI = b"\xff\xd9"  # End Of Image - JPEG 끝
+
+# 병렬 카빙 시 서브레인지 최소 크기 (32MB)
+# 프로세스 생성/결과 수집 비용이 묻힐 만큼 충분히 크게 설정
+CARVE_SUBRANGE_MIN = 32 * 1024 * 1024
+
+# 결과 전송 배치 기준
+# 이 크기 이하의 "작은" 복구 파일은 여러 개를 모아 한 번의 sendmsg로 전송
+SMALL_RESULT_MAX = 512 * 1024
+# 한 배치의 최대 버퍼 수 (Linux IOV_MAX=1024보다 여유 있게 작게)
+RESULT_BATCH_MAX_BUFS = 128
+# 한 배치의 최대 총 크기 (메모리 사용량 제한)
+RESULT_BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _scan_jpeg_range(chunk_path, lo: int, hi: int, limit: int = None):
+    """
+    청크 파일의 [lo, hi) 구간에서 시작하는 JPEG들을 찾습니다.
+
+    [병렬 처리용 헬퍼]
+    ProcessPoolExecutor의 자식 프로세스에서 실행되므로 모듈 레벨
+    함수여야 합니다 (pickle 가능). 각 프로세스가 같은 청크 파일을
+    mmap으로 열므로 페이지 캐시를 공유하며, 데이터 복사가 없습니다.
+
+    [경계 처리]
+    각 서브레인지는 "SOI가 [lo, hi)에서 시작하는" 파일만 담당합니다.
+    다만 find()는 패턴 2바이트가 검색 범위 안에 완전히 들어와야
+    매칭하므로, 검색 끝을 hi보다 1바이트 연장해 경계(hi-1)에 걸친
+    SOI를 놓치지 않게 합니다. 시작 위치 기준 담당이라 연장해도
+    서브레인지끼리 같은 파일을 중복 발견하지 않습니다.
+    연장분이 limit(수신 워터마크)을 넘으면 창을 limit으로 자르고,
+    못 본 구간은 unresolved로 표시해 수신 완료 후 재검색합니다.
+    EOI는 구간 끝을 넘어 청크 끝까지 검색합니다 (경계에 걸친 파일).
+
+    [매개변수]
+    chunk_path: 청크 파일 경로
+    lo (int): SOI 검색 시작 오프셋 (청크 내, 포함)
+    hi (int): SOI 검색 끝 오프셋 (청크 내, 미포함)
+    limit (int): EOI 검색 상한 (미포함). 수신이 끝나지 않은 파일을
+        스캔할 때 아직 도착하지 않은 영역을 읽지 않도록 제한.
+        None이면 파일 끝까지 검색.
+
+    [반환값]
+    (pairs, unresolved) 튜플:
+    - pairs: (시작, 끝) 튜플 리스트 (청크 내 오프셋, 끝은 EOI 포함 경계)
+    - unresolved: limit 때문에 판정을 끝내지 못한 첫 위치 (없으면 -1)
+        EOI를 못 찾은 SOI, 또는 워터마크에 잘린 SOI 검색 창의 끝.
+        수신 완료 후 이 위치부터 재검색해야 함
+    """
+    pairs = []
+    unresolved = -1
+    with open(chunk_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # madvise: 커널에 접근 패턴 힌트 제공 (지원 플랫폼에서만)
+        # MADV_SEQUENTIAL: 순차 접근 예정 -> 적극적인 read-ahead
+        # MADV_WILLNEED: 곧 사용할 예정 -> 미리 페이지 로드 시작
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.madvise(mmap.MADV_WILLNEED)
+
+        size = mm.size()
+        if limit is None:
+            limit = size
+
+        # SOI 검색 창 끝: 경계(hi-1)에 걸친 SOI 대응으로 1바이트
+        # 연장하되(docstring의 [경계 처리] 참고), limit(수신 워터마크)은
+        # 넘지 않음. 워터마크 밖은 ftruncate로 0이 채워진 미수신
+        # 영역이라, 연장분을 그대로 읽으면 hi-1에서 시작하는 진짜
+        # SOI의 둘째 바이트가 0으로 보여 못 찾은 채 지나치게 됨
+        soi_end = min(hi + len(SOI) - 1, size)
+        soi_truncated = soi_end > limit
+        if soi_truncated:
+            soi_end = limit
+
+        idx = lo
+        while idx < hi:
+            # SOI (FF D8) 찾기 - 이 구간에서 "시작"하는 파일만 담당
+            # find()는 C 레벨의 워드 단위 검색이라 이 루프는 실제
+            # 매칭 후보당 한 번만 Python으로 돌아옴
+            s = mm.find(SOI, idx, soi_end)
+            if s < 0:
+                if soi_truncated:
+                    # 검색 창이 워터마크에 잘림 - 잘린 끝(limit-1)에서
+                    # 시작하는 SOI는 지금은 찾을 수 없으므로 수신 완료 후
+                    # 그 지점부터 재검색하도록 표시
+                    unresolved = max(idx, soi_end - 1)
+                break
+
+            # 헤더 검증: 진짜 JPEG은 SOI 바로 뒤에 세그먼트 마커(FF xx)가 옴
+            # 무작위 데이터에서 FF D8은 약 64KB마다 한 번꼴로 나타나는데,
+            # 바이트 하나만 확인하면 오탐의 255/256을 EOI 검색 없이 걸러냄
+            if s + 2 >= limit:
+                # 검증할 바이트가 limit 밖 - 아직 수신되지 않은 영역은
+                # ftruncate로 0이 채워져 있어 읽으면 진짜 JPEG을 오탐으로
+                # 오인해 영구히 버리게 됨. 수신 완료 후 재검색하도록 표시
+                if limit < size:
+                    unresolved = s
+                break
+            if mm[s + 2] != 0xFF:
+                idx = s + 2
+                continue
+
+            # EOI (FF D9)는 구간 경계를 넘어 limit까지 검색
+            e = mm.find(EOI, s + 2, limit)
+            if e < 0:
+                if limit < size:
+                    # 아직 수신되지 않은 영역에 EOI가 있을 수 있음
+                    # -> 수신 완료 후 이 SOI부터 재검색하도록 표시
+                    unresolved = s
+                break  # limit까지 EOI 없음
+
+            pairs.append((s, e + 2))
+
+            # EOI 다음부터 계속 검색 (파일 내부의 중첩 SOI는 건너뜀)
+            idx = e + 2
+    return pairs, unresolved
+
 
 # ============================================================================
 # 유틸리티 함수 (Utility Functions)
@@ -134,21 +325,31 @@ class ProgressBar:
     \\r (캐리지 리턴)을 사용하여 커서를 줄 맨 앞으로 이동한 후
     같은 줄에 새 내용을 덮어씁니다.
     이렇게 하면 한 줄에서 진행률이 업데이트되는 효과를 얻습니다.
-    
+
+    [출력 스레드 분리]
+    화면 출력은 별도의 데몬 스레드(ticker)가 1초마다 수행합니다.
+    수신/전송 루프(핫 패스)의 update()는 카운터 덧셈 한 번이 전부라
+    print + flush의 tty write 시스템 콜이 핫 패스에서 완전히 빠집니다.
+    (100MB 수신이면 수천 번의 tty write가 수십 번으로 줄어듦)
+    단일 쓰기 스레드의 정수 덧셈이므로 락도 필요 없습니다.
+
     [출력 형식 예시]
     [청크 수신] |████████████░░░░░░░░░░░░░░░░░░| 40.5% (5.91GB/14.59GB) 62.3MB/s 남은 시간: 2.3분
-    
+
     [사용 예시]
     >>> progress = ProgressBar(total=1000000, description="다운로드")
     >>> for i in range(0, 1000000, 10000):
     ...     progress.update(10000)  # 10000바이트 처리됨
     >>> progress.finish()
     """
-    
+
+    # 화면 갱신 주기 (초) - ticker 스레드가 이 간격으로만 출력
+    PRINT_INTERVAL = 1.0
+
     def __init__(self, total, description="진행"):
         """
         ProgressBar 생성자
-        
+
         [매개변수]
         total (int): 전체 처리해야 할 양 (바이트 등)
         description (str): 진행률 앞에 표시할 설명
@@ -157,28 +358,35 @@ class ProgressBar:
         self.current = 0               # 현재까지 처리된 양
         self.description = description # 표시할 설명 텍스트
         self.start_time = time.time()  # 시작 시간 (경과 시간 및 속도 계산용)
-        self.last_print_time = 0       # 마지막 출력 시간 (너무 자주 출력하지 않기 위해)
         self.bar_width = 30            # 프로그레스 바의 문자 폭
-    
+
+        # 출력 전용 데몬 스레드 시작
+        # daemon=True: 메인 스레드 종료 시 함께 종료 (프로그램을 붙잡지 않음)
+        self._stop = threading.Event()
+        self._ticker = threading.Thread(target=self._tick, daemon=True)
+        self._ticker.start()
+
     def update(self, amount):
         """
-        진행률을 업데이트합니다.
-        
+        진행률을 업데이트합니다. (핫 패스 - 카운터 덧셈만 수행)
+
         [매개변수]
         amount (int): 이번에 처리된 양
-        
-        [참고]
-        너무 자주 화면을 갱신하면 성능이 저하되므로
-        0.3초 간격으로만 출력합니다.
         """
-        self.current += amount  # 현재 처리량 누적
-        now = time.time()
-        
-        # 0.3초마다 또는 완료 시 출력
-        if now - self.last_print_time >= 0.3 or self.current >= self.total:
-            self.last_print_time = now
+        # 출력은 ticker 스레드가 담당하므로 여기서는 누적만
+        self.current += amount
+
+    def _tick(self):
+        """
+        1초 간격으로 진행률을 출력하는 데몬 스레드 본체입니다.
+        (private 메서드 - 클래스 내부에서만 사용)
+
+        Event.wait(간격)은 finish()가 stop을 set하면 즉시 깨어나므로
+        종료 시 최대 1초를 기다리는 일이 없습니다.
+        """
+        while not self._stop.wait(self.PRINT_INTERVAL):
             self._print_progress()
-    
+
     def _print_progress(self):
         """
         현재 진행률을 화면에 출력합니다.
@@ -235,7 +443,12 @@ class ProgressBar:
         """
         진행률 표시를 완료하고 결과를 출력합니다.
         100% 완료 메시지와 평균 속도를 표시합니다.
+        ticker 스레드를 멈춘 뒤 출력하므로 완료 줄이 덮어써지지 않습니다.
         """
+        # 출력 스레드 정지 (wait 중이면 즉시 깨어남)
+        self._stop.set()
+        self._ticker.join()
+
         elapsed = time.time() - self.start_time
         
         # 평균 속도 계산
@@ -288,25 +501,31 @@ class FileCarvingWorker:
     - local_out_dir: 복구된 파일을 임시 저장하는 로컬 디렉토리
     """
     
-    def __init__(self, master_host: str, master_port: int, stream_block_size=4 * 1024 * 1024):
+    def __init__(self, master_host: str, master_port: int,
+                 stream_block_size=4 * 1024 * 1024, save_local=False):
         """
         FileCarvingWorker 생성자
-        
+
         [매개변수]
         master_host (str): 마스터 서버의 IP 주소 또는 호스트명
             예: "192.168.1.100", "localhost"
-            
+
         master_port (int): 마스터 서버의 포트 번호
             예: 5000
-            
+
         stream_block_size (int): 스트리밍 블록 크기 (기본값: 4MB)
             - 파일을 읽고 쓸 때 한 번에 처리하는 크기
             - 너무 작으면 I/O 오버헤드 증가
             - 너무 크면 메모리 사용량 증가
+
+        save_local (bool): 복구된 JPEG을 로컬에도 파일로 저장할지 여부
+            - 기본값 False: 청크 파일에서 소켓으로 바로 전송 (디스크
+              왕복 없음). 디버깅/로컬 보관이 필요할 때만 켭니다.
         """
         self.master_host = master_host
         self.master_port = master_port
         self.stream_block_size = stream_block_size
+        self.save_local = save_local
         
         self.socket = None      # 마스터와 연결된 소켓 (연결 전에는 None)
         self.worker_id = None   # 워커 ID (연결 후 설정)
@@ -315,10 +534,45 @@ class FileCarvingWorker:
         # 워커 식별 및 로깅에 사용
         self.hostname = socket.gethostname()
 
-        # 복구된 파일을 임시로 저장할 로컬 디렉토리
-        # 나중에 마스터로 전송한 후에도 로컬에 남아있음
-        self.local_out_dir = Path("worker_recovered")
-        self.local_out_dir.mkdir(exist_ok=True)  # 디렉토리 생성 (이미 있으면 무시)
+        # 복구된 파일을 저장할 로컬 디렉토리 (save_local=True일 때만 사용)
+        # 기본 경로에서는 복구 파일을 디스크에 쓰지 않고 청크 파일에서
+        # 소켓으로 바로 전송하므로 이 디렉토리는 만들지 않음
+        #
+        # 가능하면 tmpfs(/dev/shm)를 사용:
+        # 복구 파일은 "쓰기 -> 전송을 위해 재읽기" 패턴이라 tmpfs에 두면
+        # 블록 장치를 전혀 거치지 않고 페이지 캐시 안에서만 오간다.
+        # (물리 디스크에 dirty page 쓰기 압박도 없음)
+        shm = Path("/dev/shm")
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            self.local_out_dir = shm / "worker_recovered"
+        else:
+            # tmpfs가 없는 플랫폼(Windows/macOS)은 기존처럼 현재 디렉토리
+            self.local_out_dir = Path("worker_recovered")
+        if self.save_local:
+            self.local_out_dir.mkdir(exist_ok=True)  # 이미 있으면 무시
+
+        # 수신 전용 재사용 버퍼 (1MB)
+        # recv()는 호출할 때마다 새 bytes 객체를 할당하지만,
+        # recv_into()는 이 버퍼에 직접 기록하므로 청크당 할당/복사가 사라짐
+        self._recv_buf = bytearray(1024 * 1024)
+
+        # 길이 헤더(4/8바이트) 전용 고정 버퍼
+        # 헤더는 struct.unpack_from으로 이 버퍼에서 바로 읽으므로
+        # 제어 경로에서 bytes 객체 할당이 전혀 발생하지 않음
+        self._hdr_buf = bytearray(8)
+
+        # MSG_ZEROCOPY 지원 여부 (connect()에서 SO_ZEROCOPY 설정 성공 시 True)
+        self._zerocopy = False
+        # zero-copy 송신 후 커널이 완료를 알릴 때까지 참조를 유지해야 하는 버퍼들
+        # (완료 전에 버퍼 메모리가 재사용되면 잘못된 데이터가 전송될 수 있음)
+        # 각 항목은 (마지막 send 호출의 시퀀스 번호, 버퍼) 쌍
+        self._zc_pending = []
+        # MSG_ZEROCOPY send() 호출마다 커널이 매기는 시퀀스 번호 추적
+        # (커널은 소켓별로 0부터 1씩 증가시키며, 완료 통지에 범위로 담아 보냄)
+        self._zc_seq = -1
+        # 완료 통지를 더는 받을 수 없게 됐지만 커널이 아직 페이지를
+        # 참조 중일 수 있는 버퍼들. 소켓이 닫힐 때까지 참조만 유지
+        self._zc_graveyard = []
 
     # ========================================================================
     # 네트워크 통신 헬퍼 메서드 (Networking Helper Methods)
@@ -339,31 +593,67 @@ class FileCarvingWorker:
         
         [매개변수]
         size (int): 받을 데이터의 정확한 크기 (바이트)
-        
+
         [반환값]
         bytes: 수신한 데이터 (정확히 size 바이트)
                연결이 끊어지면 빈 bytes 반환
         """
-        # bytearray: 수정 가능한(mutable) 바이트 시퀀스
-        # bytes는 불변(immutable)이라 추가할 때마다 새 객체 생성
-        # bytearray는 extend()로 효율적으로 추가 가능
-        buf = bytearray()
-        
-        while len(buf) < size:
-            # recv(n): 소켓에서 최대 n바이트 수신
-            # min(65536, size - len(buf)): 남은 크기와 64KB 중 작은 값
-            # 65536(64KB)은 일반적인 TCP 버퍼 크기
-            chunk = self.socket.recv(min(65536, size - len(buf)))
-            
-            # recv()가 빈 값을 반환하면 연결이 끊어진 것
-            if not chunk:
+        # recv()는 호출마다 새 bytes를 할당하고 extend()가 한 번 더 복사하지만,
+        # recv_into()는 미리 준비한 버퍼에 커널이 직접 기록하므로
+        # 수신 호출당 할당 1회 + 복사 1회가 사라짐
+        #
+        # 버퍼가 크면 recv_into 한 번에 커널이 수신 큐를 최대한 비우므로
+        # 64KB 단위 recv()보다 시스템 콜 횟수도 줄어듦
+        # (대용량 청크 본문은 이 함수가 아니라 mmap 매핑에 직접 수신함)
+        if size > len(self._recv_buf):
+            # 재사용 버퍼를 요청 크기로 키움 (다음 호출부터 재사용)
+            self._recv_buf = bytearray(size)
+        mv = memoryview(self._recv_buf)
+
+        filled = 0  # 지금까지 채운 바이트 수
+        while filled < size:
+            # recv_into(버퍼): 소켓 데이터를 버퍼에 직접 기록, 기록한 크기 반환
+            # mv[filled:size]: 아직 채우지 못한 구간
+            # MSG_WAITALL: 요청한 크기가 다 모일 때까지 커널이 대기
+            # -> 정상 경로에서는 메시지당 시스템 콜이 1회로 끝남
+            # (시그널 등으로 짧게 반환될 수 있으므로 루프는 유지)
+            got = self.socket.recv_into(mv[filled:size], 0, socket.MSG_WAITALL)
+
+            # 0을 반환하면 연결이 끊어진 것
+            if got == 0:
                 return b""  # 빈 bytes 반환
-            
-            # extend(): bytearray에 데이터 추가
-            buf.extend(chunk)
-        
-        # bytes 타입으로 변환하여 반환
-        return bytes(buf)
+
+            filled += got
+
+        # bytes 타입으로 변환하여 반환 (버퍼는 다음 호출에서 재사용됨)
+        return bytes(mv[:size])
+
+    def _recv_header(self, n: int) -> bool:
+        """
+        고정 길이 헤더(4바이트 또는 8바이트)를 할당 없이 수신합니다.
+
+        [왜 별도 메서드인가?]
+        _recv_exact()는 마지막에 bytes()로 변환하면서 복사/할당이
+        발생합니다. 길이 헤더는 항상 8바이트 이하이므로 고정 스크래치
+        버퍼(self._hdr_buf)에 받아두고, 호출자가
+        struct.unpack_from(..., self._hdr_buf)으로 바로 읽으면
+        제어 경로에서 할당이 완전히 사라집니다.
+
+        [매개변수]
+        n (int): 받을 헤더 크기 (최대 8바이트)
+
+        [반환값]
+        bool: 성공 여부 (연결이 끊어지면 False)
+        """
+        mv = memoryview(self._hdr_buf)[:n]
+        filled = 0
+        while filled < n:
+            # MSG_WAITALL: 헤더 n바이트가 모일 때까지 커널이 대기 (콜 1회)
+            got = self.socket.recv_into(mv[filled:], 0, socket.MSG_WAITALL)
+            if got == 0:
+                return False  # 연결 끊김
+            filled += got
+        return True
 
     def send_json(self, obj: dict) -> None:
         """
@@ -379,27 +669,21 @@ class FileCarvingWorker:
         obj (dict): 전송할 딕셔너리
         
         [동작 순서]
-        1. json.dumps(): 딕셔너리 -> JSON 문자열
+        1. json.dumps(): 딕셔너리 -> JSON 문자열 (공백 없는 압축 형식)
         2. encode("utf-8"): 문자열 -> 바이트
         3. struct.pack(): 길이를 4바이트로 패킹
-        4. sendall(): 길이 전송
-        5. sendall(): 데이터 전송
-        
+        4. sendall(): 길이+데이터를 한 번에 전송
+
         [사용 예시]
         >>> worker.send_json({"status": "ready", "worker_id": "worker_12345"})
         """
-        # json.dumps(obj): Python 딕셔너리를 JSON 문자열로 변환
-        # encode("utf-8"): 문자열을 UTF-8 바이트로 인코딩
-        payload = json.dumps(obj).encode("utf-8")
-        
-        # struct.pack(format, value): 값을 지정된 형식의 바이트로 변환
-        # "!I": 네트워크 바이트 순서, 4바이트 unsigned int
-        # len(payload): JSON 데이터의 길이
-        self.socket.sendall(struct.pack(JSON_LEN_FMT, len(payload)))
-        
-        # sendall(): 모든 데이터가 전송될 때까지 대기
-        # send()와 달리 부분 전송 걱정 없이 전체 전송 보장
-        self.socket.sendall(payload)
+        # 딕셔너리 -> JSON bytes (orjson 또는 표준 json - 상단 참고)
+        payload = json_dumps_bytes(obj)
+
+        # 길이 프리픽스와 페이로드를 이어 붙여 sendall 한 번으로 전송
+        # 따로 보내면 시스템 콜이 2배이고, TCP_NODELAY 상태에서는
+        # 작은 세그먼트도 2개로 나가게 됨
+        self.socket.sendall(JSON_LEN_STRUCT.pack(len(payload)) + payload)
 
     def recv_json(self):
         """
@@ -418,274 +702,502 @@ class FileCarvingWorker:
         3. 길이만큼 JSON 데이터 수신
         4. UTF-8 디코딩 후 JSON 파싱
         """
-        # 1. 길이 정보 수신 (4바이트)
-        size_b = self._recv_exact(JSON_LEN_SIZE)
-        if not size_b:
+        # 1. 길이 정보 수신 (4바이트, 고정 버퍼에 할당 없이)
+        if not self._recv_header(JSON_LEN_SIZE):
             return None  # 연결 끊김
-        
-        # 2. struct.unpack(): 바이트를 Python 값으로 변환
+
+        # 2. unpack_from(): 고정 버퍼에서 바로 값 추출 (중간 bytes 없음)
         # 반환값은 튜플이므로 [0]으로 첫 번째 요소 추출
-        size = struct.unpack(JSON_LEN_FMT, size_b)[0]
+        size = JSON_LEN_STRUCT.unpack_from(self._hdr_buf)[0]
         
         # 3. JSON 데이터 수신
         payload = self._recv_exact(size)
         if not payload:
             return None
         
-        # 4. 바이트 -> 문자열 -> 딕셔너리
-        # decode("utf-8"): 바이트를 UTF-8 문자열로 디코딩
-        # json.loads(): JSON 문자열을 딕셔너리로 파싱
-        return json.loads(payload.decode("utf-8"))
+        # 4. JSON 파싱 (orjson 또는 표준 json - 상단 json_loads_bytes 참고)
+        return json_loads_bytes(payload)
 
-    def recv_binary_stream_to_file_with_progress(self, out_path: Path) -> int:
+    def _send_vec(self, bufs) -> None:
         """
-        마스터로부터 바이너리 데이터를 수신하여 파일로 저장합니다.
-        진행률을 화면에 표시합니다.
-        
+        여러 버퍼를 한 번의 sendmsg() 시스템 콜로 전송합니다 (vectored I/O).
+
+        [왜 필요한가?]
+        sendall()을 버퍼마다 호출하면 버퍼 수만큼 커널 진입/복귀가
+        발생합니다. sendmsg()는 버퍼 리스트(scatter-gather)를 받아
+        한 번의 시스템 콜로 전송하므로 헤더+데이터처럼 붙어 나가는
+        작은 버퍼들의 시스템 콜 비용이 합쳐집니다.
+
+        [매개변수]
+        bufs (list): 전송할 버퍼(bytes/memoryview) 리스트
+        """
+        if not HAVE_SENDMSG:
+            # sendmsg 미지원 플랫폼(Windows): 버퍼별 sendall 폴백
+            # 시스템 콜이 버퍼 수만큼 늘지만 전송 결과는 동일
+            for b in bufs:
+                if len(b) > 0:
+                    self.socket.sendall(b)
+            return
+
+        # sendmsg는 일부만 전송할 수 있으므로 전부 나갈 때까지 반복
+        views = [memoryview(b) for b in bufs if len(b) > 0]
+        while views:
+            n = self.socket.sendmsg(views)
+            # 전송된 n바이트만큼 앞쪽 버퍼들을 소진 처리
+            while n > 0:
+                if n >= len(views[0]):
+                    n -= len(views[0])
+                    views.pop(0)
+                else:
+                    views[0] = views[0][n:]
+                    n = 0
+
+    def _drain_zerocopy(self, wait: bool = False) -> None:
+        """
+        MSG_ZEROCOPY 완료 통지를 에러 큐(MSG_ERRQUEUE)에서 회수합니다.
+
+        [왜 필요한가?]
+        zero-copy 송신은 사용자 버퍼의 페이지를 커널이 직접 참조합니다.
+        커널이 전송 완료를 알리기 전에 버퍼를 재사용하면 잘못된 데이터가
+        나갈 수 있으므로, 완료 통지를 받은 후에야 버퍼 참조를 놓습니다.
+
+        [완료 통지 형식]
+        커널은 완료를 sock_extended_err 구조체(ee_errno: u32,
+        ee_origin/ee_type/ee_code/ee_pad: u8 x 4, ee_info: u32, ee_data: u32)로
+        전달하며, 여러 send 호출의 완료를 [ee_info, ee_data] 시퀀스 번호
+        범위 하나로 묶어서(coalescing) 보낼 수 있습니다. 따라서 통지 1건당
+        버퍼 1개가 아니라 범위에 포함된 만큼을 해제해야 합니다.
+
+        [매개변수]
+        wait (bool): True면 대기 중인 버퍼가 모두 완료될 때까지 잠시 대기
+        """
+        if not self._zc_pending:
+            return
+        import select
+        deadline = time.time() + (1.0 if wait else 0)
+        while self._zc_pending:
+            try:
+                # MSG_ERRQUEUE: 에러 큐에서 완료 통지 읽기 (논블로킹)
+                _, ancdata, _, _ = self.socket.recvmsg(
+                    0, 1024, socket.MSG_ERRQUEUE | socket.MSG_DONTWAIT)
+                for _level, _type, cmsg_data in ancdata:
+                    if len(cmsg_data) < 16:
+                        continue
+                    # ee_origin == SO_EE_ORIGIN_ZEROCOPY(5)인 통지만 해당
+                    ee_origin = cmsg_data[4]
+                    if ee_origin != 5:
+                        continue
+                    # 완료된 시퀀스 범위의 끝(ee_data)까지의 버퍼를 모두 해제
+                    ee_data = struct.unpack_from("=I", cmsg_data, 12)[0]
+                    while self._zc_pending and self._zc_pending[0][0] <= ee_data:
+                        self._zc_pending.pop(0)
+            except BlockingIOError:
+                # 아직 완료 통지가 없음
+                if not wait or time.time() >= deadline:
+                    break
+                # 에러 큐는 select의 예외 조건으로 통지됨
+                select.select([], [], [self.socket], 0.05)
+            except OSError:
+                # 에러 큐 접근 실패 - 더는 완료 통지를 받을 수 없지만,
+                # 커널이 아직 버퍼 페이지를 DMA 참조 중일 수 있으므로
+                # 여기서 참조를 놓으면 재사용된 메모리가 전송될 수 있음.
+                # 소켓이 닫힐 때까지 묘지 목록에 옮겨 붙잡아 둠
+                self._zc_graveyard.extend(self._zc_pending)
+                self._zc_pending.clear()
+                break
+
+    def _send_large(self, data) -> None:
+        """
+        큰 페이로드를 전송합니다. 가능하면 MSG_ZEROCOPY를 사용합니다.
+
+        [동작]
+        - ZEROCOPY_MIN_SIZE(16KB) 이상이고 SO_ZEROCOPY가 설정된 경우:
+          send(data, MSG_ZEROCOPY)로 커널 복사 없이 전송
+        - 그 외: 일반 sendall (작은 전송은 복사 비용이 무시할 수준)
+
+        [매개변수]
+        data (bytes/memoryview): 전송할 데이터
+        """
+        if not (self._zerocopy and len(data) >= ZEROCOPY_MIN_SIZE):
+            self.socket.sendall(data)
+            return
+
+        mv = memoryview(data)
+        sent = 0
+        seq_before = self._zc_seq  # 이 호출에서 zero-copy send가 나갔는지 추적
+        try:
+            while sent < len(mv):
+                try:
+                    sent += self.socket.send(mv[sent:], MSG_ZEROCOPY)
+                    # send 호출이 성공할 때마다 커널 시퀀스 번호가 1씩 증가
+                    self._zc_seq += 1
+                except OSError as e:
+                    import errno
+                    if e.errno == errno.ENOBUFS:
+                        # 커널의 고정 가능 페이지 한도 초과 -> 완료 회수 후 재시도
+                        self._drain_zerocopy(wait=True)
+                        continue
+                    raise
+        except OSError:
+            # zero-copy 미지원(예: 루프백에서 EOPNOTSUPP 아닌 일반 복사 폴백 실패)
+            # -> 남은 부분은 일반 전송으로 마무리하고 이후 비활성화
+            self._zerocopy = False
+            self.socket.sendall(mv[sent:])
+            if self._zc_seq != seq_before:
+                # 앞부분이 이미 MSG_ZEROCOPY로 나갔다면 sendall로 마무리
+                # 했어도 커널은 그 페이지들을 참조 중 - 완료 통지까지
+                # 버퍼 참조를 유지해야 재사용 오염을 막을 수 있음
+                self._zc_pending.append((self._zc_seq, data))
+            return
+
+        # 완료 통지가 올 때까지 버퍼 참조 유지
+        # (이 페이로드의 마지막 send 시퀀스 번호까지 완료되면 해제 가능)
+        self._zc_pending.append((self._zc_seq, data))
+        if len(self._zc_pending) >= 32:
+            self._drain_zerocopy(wait=True)
+
+    def recv_and_carve_with_progress(self, out_path: Path, base_offset: int):
+        """
+        청크를 수신하면서 이미 도착한 구간을 동시에 카빙합니다.
+        (수신 + 카빙 2단계 파이프라인)
+
         [프로토콜 형식]
         [8바이트: 데이터 길이][바이너리 데이터 스트림...]
-        
-        [왜 파일로 저장하는가?]
-        청크가 수 GB일 수 있어서 메모리에 전부 올리면 OutOfMemory 발생.
-        파일로 저장하면 디스크 공간만 있으면 됩니다.
-        
+
+        [파이프라인 구조]
+        기존 흐름은 "전체 수신 -> 전체 카빙"의 직렬 처리였습니다.
+        이제 메인 스레드가 mmap 매핑에 recv_into로 수신하는 동안,
+        수신 완료 지점(watermark)을 넘어선 서브레인지를 즉시 프로세스
+        풀에 제출합니다. NIC 수신(I/O)과 카빙(CPU)이 동시에 진행되어
+        태스크당 소요 시간이 합계가 아닌 max(수신, 카빙)에 수렴합니다.
+
+        결과 전송 단계는 프로토콜상 복구 개수를 먼저 보내야 하므로
+        카빙 완료 후에만 시작할 수 있어 파이프라인에 넣지 않습니다.
+
+        [경계 처리]
+        watermark까지만 EOI를 검색하므로, 아직 도착하지 않은 영역에
+        EOI가 있는 파일은 "미해결(unresolved)"로 표시되고 수신 완료 후
+        해당 SOI부터 재검색합니다.
+
         [매개변수]
-        out_path (Path): 저장할 파일 경로
-        
+        out_path (Path): 청크를 저장할 파일 경로
+        base_offset (int): 이 청크의 원본 DD 이미지에서의 시작 오프셋
+
         [반환값]
-        int: 수신한 총 바이트 수 (실패 시 -1)
+        (received, found) 튜플:
+        - received (int): 수신한 총 바이트 수 (실패 시 -1)
+        - found (list): 발견된 JPEG 파일 정보 리스트
         """
-        # 1. 길이 정보 수신 (8바이트)
-        size_b = self._recv_exact(BIN_LEN_SIZE)
-        if not size_b:
-            return -1
-        
+        # 1. 길이 정보 수신 (8바이트, 고정 버퍼에 할당 없이)
+        if not self._recv_header(BIN_LEN_SIZE):
+            return -1, []
+
         # "!Q": 8바이트 unsigned long long
-        total = struct.unpack(BIN_LEN_FMT, size_b)[0]
+        total = BIN_LEN_STRUCT.unpack_from(self._hdr_buf)[0]
 
-        remaining = total  # 남은 수신량
-        
         # 부모 디렉토리 생성 (필요한 경우)
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 진행률 표시 객체 생성
-        progress = ProgressBar(total, "청크 수신")
-
-        # 파일에 기록 ("wb": write binary 모드)
-        with open(out_path, "wb") as f:
-            while remaining > 0:
-                # 소켓에서 데이터 수신 (최대 64KB씩)
-                chunk = self.socket.recv(min(65536, remaining))
-                if not chunk:
-                    raise IOError("Socket closed while receiving binary")
-                
-                # 파일에 기록
-                f.write(chunk)
-                remaining -= len(chunk)
-                
-                # 진행률 업데이트
-                progress.update(len(chunk))
-        
-        # 완료 메시지 출력
-        progress.finish()
-        return total
-
-    def send_binary_stream_from_file_with_progress(self, file_path: Path, 
-                                                    file_num: int, total_files: int) -> int:
+        if total == 0:
+            # 빈 스트림: 빈 파일만 만들고 종료 (mmap은 빈 파일 불가)
+            out_path.touch()
+            return 0, []
+
+        # 서브레인지 분할: 코어 수만큼 나누되 최소 32MB 보장
+        ncpu = os.cpu_count() or 1
+        sub = max(CARVE_SUBRANGE_MIN, -(-total // ncpu))  # 올림 나눗셈
+        ranges = [(lo, min(lo + sub, total))
+                  for lo in range(0, total, sub)]
+
+        # 구간이 여러 개일 때만 풀 생성 (작은 청크는 수신 후 인라인 스캔)
+        executor = ProcessPoolExecutor(max_workers=min(ncpu, len(ranges))) \
+            if len(ranges) > 1 else None
+
+        progress = ProgressBar(total, "수신+카빙")
+
+        pairs = []       # (시작, 끝) 청크 내 오프셋 쌍
+        rescan = []      # 수신 완료 후 재검색할 (시작, 구간 끝) 목록
+        futures = {}     # future -> (lo, hi)
+
+        def collect(future):
+            """완료된 스캔 결과를 회수하고 미해결 지점을 기록합니다."""
+            got_pairs, unresolved = future.result()
+            pairs.extend(got_pairs)
+            if unresolved >= 0:
+                rescan.append((unresolved, futures[future][1]))
+
+        # 출력 파일을 최종 크기로 만든 뒤 통째로 매핑
+        # O_RDWR: mmap 쓰기 매핑에는 읽기/쓰기 fd 필요
+        fd = os.open(out_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # ftruncate: 파일 크기를 미리 확정 (매핑 크기의 기준)
+            os.ftruncate(fd, total)
+
+            mm = mmap.mmap(fd, total)
+            try:
+                # 소켓 -> 매핑으로 직접 수신 (중간 버퍼/write 콜 없음)
+                # 매핑은 MAP_SHARED이므로 자식 프로세스가 같은 파일을
+                # mmap하면 방금 수신한 페이지를 그대로 보게 됨
+                mv = memoryview(mm)
+                try:
+                    filled = 0       # 수신 watermark
+                    next_range = 0   # 다음에 제출할 서브레인지 인덱스
+                    while filled < total:
+                        got = self.socket.recv_into(mv[filled:total])
+                        if got == 0:
+                            raise IOError("Socket closed while receiving binary")
+                        filled += got
+
+                        # 진행률 업데이트
+                        progress.update(got)
+
+                        # 수신이 끝난 서브레인지를 풀에 제출
+                        # (EOI 검색 상한 = 현재 watermark)
+                        while (executor is not None
+                               and next_range < len(ranges)
+                               and ranges[next_range][1] <= filled):
+                            lo, hi = ranges[next_range]
+                            fut = executor.submit(
+                                _scan_jpeg_range, out_path, lo, hi, filled)
+                            futures[fut] = (lo, hi)
+                            next_range += 1
+                finally:
+                    # mmap을 닫기 전에 매핑을 가리키는 뷰를 먼저 해제해야 함
+                    mv.release()
+            finally:
+                mm.close()
+
+            progress.finish()
+
+            # 2. 수신 완료 - 남은 스캔 마무리
+            if executor is not None:
+                # 아직 제출하지 않은 구간 제출 (이제 전체가 도착했으므로 상한 없음)
+                while next_range < len(ranges):
+                    lo, hi = ranges[next_range]
+                    futures[executor.submit(_scan_jpeg_range, out_path, lo, hi)] \
+                        = (lo, hi)
+                    next_range += 1
+
+                for future in as_completed(list(futures)):
+                    collect(future)
+
+                # 미해결 지점(watermark 너머에 EOI가 있던 SOI) 재검색
+                redo = [executor.submit(_scan_jpeg_range, out_path, s, hi)
+                        for s, hi in rescan]
+                for future in redo:
+                    got_pairs, _ = future.result()
+                    pairs.extend(got_pairs)
+
+                executor.shutdown()
+            else:
+                # 단일 구간: 현재 프로세스에서 스캔
+                got_pairs, _ = _scan_jpeg_range(out_path, 0, total)
+                pairs.extend(got_pairs)
+        except BaseException:
+            progress._stop.set()  # 에러 메시지 위에 진행률이 계속 찍히지 않도록
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            os.close(fd)
+
+        # 3. 매칭 구간을 파일로 저장
+        found = self._write_matches(out_path, base_offset, pairs)
+        return total, found
+
+    def send_result_from_chunk(self, meta: dict, chunk_fd: int, start: int,
+                               total: int, file_num: int, total_files: int) -> int:
         """
-        파일을 바이너리 스트림으로 마스터에게 전송합니다.
-        진행률을 화면에 표시합니다.
-        
+        복구된 파일 하나(메타데이터 + 데이터)를 청크 파일에서 바로
+        마스터에게 전송합니다. 진행률을 화면에 표시합니다.
+
         [프로토콜 형식]
-        [8바이트: 데이터 길이][바이너리 데이터 스트림...]
-        
+        [4바이트: JSON 길이][메타 JSON][8바이트: 데이터 길이][바이너리 스트림...]
+
+        [중간 파일 없음]
+        복구된 구간을 .jpg로 저장했다가 다시 읽는 대신 청크 파일의
+        해당 구간을 직접 보냅니다. 본문은 가능하면 os.sendfile로 전송해
+        페이지 캐시 -> 소켓으로 커널 내부 복사만 일어납니다 (사용자
+        공간을 전혀 거치지 않음).
+
+        [시스템 콜 병합]
+        메타 JSON 프레임, 8바이트 바이너리 길이, 첫 데이터 블록을
+        하나의 sendmsg() 호출로 묶어 전송합니다.
+
         [매개변수]
-        file_path (Path): 전송할 파일 경로
+        meta (dict): 파일 메타데이터 ({"offset": ..., "size": ...})
+        chunk_fd (int): 청크 파일의 파일 디스크립터
+        start (int): 청크 내 구간 시작 오프셋
+        total (int): 구간 크기 (바이트)
         file_num (int): 현재 파일 번호 (0부터 시작, 진행률 표시용)
         total_files (int): 전체 파일 수 (진행률 표시용)
-        
+
         [반환값]
-        int: 전송한 총 바이트 수
+        int: 전송한 총 바이트 수 (파일 데이터 기준)
         """
-        # stat().st_size: 파일 크기 (바이트)
-        total = file_path.stat().st_size
-        
-        # 8바이트 길이 정보 먼저 전송
-        self.socket.sendall(struct.pack(BIN_LEN_FMT, total))
+        # 메타 JSON 프레임 + 바이너리 길이를 하나의 헤더로 구성
+        meta_payload = json_dumps_bytes(meta)
+        hdr = (JSON_LEN_STRUCT.pack(len(meta_payload))
+               + meta_payload
+               + BIN_LEN_STRUCT.pack(total))
 
         # 작은 파일은 진행률 표시 생략 (512KB 미만)
+        # 출력은 1초 간격으로만 수행 (블록마다 tty write 시스템 콜 방지)
         show_progress = total > 512 * 1024
-
-        # 파일에서 읽어서 전송 ("rb": read binary)
-        with open(file_path, "rb") as f:
-            remaining = total  # 남은 전송량
-            sent = 0           # 전송 완료량
-            
-            while remaining > 0:
-                # 파일에서 데이터 읽기 (블록 크기와 남은 크기 중 작은 값)
-                data = f.read(min(self.stream_block_size, remaining))
+        last_print = 0.0
+
+        # 첫 블록은 헤더와 함께 한 번의 sendmsg로 전송
+        # _pread: fd 위치 포인터를 건드리지 않고 지정 오프셋에서 읽기
+        # (pread 미지원 플랫폼에서는 락 보호 seek+read - 상단 참고)
+        first = _pread(chunk_fd, min(self.stream_block_size, total), start)
+        self._send_vec([hdr, first])
+
+        sent = len(first)  # 전송 완료량
+
+        # 나머지는 가능하면 sendfile로 커널 내부 전송
+        use_sendfile = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+        sock_fd = self.socket.fileno()
+
+        while sent < total:
+            block = min(self.stream_block_size, total - sent)
+
+            if use_sendfile:
+                try:
+                    n = os.sendfile(sock_fd, chunk_fd, start + sent, block)
+                except OSError:
+                    # 플랫폼/소켓 상태에 따라 미지원 -> pread 폴백
+                    use_sendfile = False
+                    continue
+                if n == 0:
+                    raise IOError("Socket closed while sending result")
+                sent += n
+            else:
+                data = _pread(chunk_fd, block, start + sent)
                 if not data:
-                    raise IOError("Unexpected EOF while sending file")
-                
-                # 소켓으로 전송
-                self.socket.sendall(data)
-                remaining -= len(data)
+                    raise IOError("Unexpected EOF while sending result")
+                # 소켓으로 전송 (큰 블록은 MSG_ZEROCOPY 시도)
+                self._send_large(data)
                 sent += len(data)
-                
-                # 진행률 표시 (큰 파일만)
-                if show_progress:
+
+            # 진행률 표시 (큰 파일만, 1초 간격)
+            if show_progress:
+                now = time.monotonic()
+                if now - last_print >= ProgressBar.PRINT_INTERVAL:
+                    last_print = now
                     percent = (sent / total) * 100
                     print(f"\r[결과 전송] 파일 {file_num+1}/{total_files}: "
                           f"{format_size(sent)}/{format_size(total)} ({percent:.0f}%)    ", end="")
                     sys.stdout.flush()
-        
+
         # 완료 메시지 (큰 파일만)
         if show_progress:
             print(f"\r[결과 전송] 파일 {file_num+1}/{total_files}: {format_size(total)} 완료!    ")
-        
+
         return total
 
     # ========================================================================
     # JPEG 카빙 메서드 (JPEG Carving Methods)
     # ========================================================================
 
-    def carve_jpeg_from_file_with_progress(self, chunk_path: Path, base_offset: int, 
-                                           scan_block=8 * 1024 * 1024, 
-                                           tail_keep=2 * 1024 * 1024):
+    def _write_matches(self, chunk_path: Path, base_offset: int, pairs: list):
         """
-        청크 파일에서 JPEG 파일들을 카빙(추출)합니다.
-        
-        [JPEG 구조]
-        JPEG 파일은 다음과 같은 구조를 가집니다:
-        - SOI (Start Of Image): FF D8 - 파일 시작 마커
-        - 여러 세그먼트 (JFIF, DQT, DHT, SOF, SOS 등)
-        - 이미지 데이터
-        - EOI (End Of Image): FF D9 - 파일 끝 마커
-        
-        [알고리즘]
-        1. 청크를 블록 단위로 읽음 (메모리 절약)
-        2. FF D8 (SOI) 패턴 검색
-        3. SOI 발견 시 이후에서 FF D9 (EOI) 검색
-        4. SOI ~ EOI 사이의 데이터를 JPEG 파일로 저장
-        
-        [오버랩 처리]
-        블록 경계에서 시그니처가 잘릴 수 있으므로,
-        이전 블록의 끝부분(tail_keep)을 다음 블록과 함께 처리합니다.
-        
-        예: 블록1 끝이 "...FF", 블록2 시작이 "D8..."인 경우
-            tail_keep이 없으면 SOI(FF D8)를 놓침
-        
+        스캔으로 찾은 (시작, 끝) 구간들을 결과 목록으로 정리합니다.
+
+        기본 동작은 구간 정보(청크 내 시작 위치 포함)만 수집합니다.
+        전송 단계가 청크 파일에서 바로 읽어 보내므로 중간 .jpg 파일이
+        필요 없기 때문입니다. save_local=True일 때만 구간별 .jpg 파일도
+        로컬에 저장합니다 (디버깅/보관용).
+
         [매개변수]
-        chunk_path (Path): 카빙할 청크 파일 경로
+        chunk_path (Path): 청크 파일 경로
         base_offset (int): 이 청크의 원본 DD 이미지에서의 시작 오프셋
             - 복구된 파일의 정확한 위치 정보를 위해 필요
-        scan_block (int): 한 번에 읽어서 검색할 블록 크기 (기본값: 8MB)
-        tail_keep (int): 블록 경계 처리를 위해 유지할 끝부분 크기 (기본값: 2MB)
-        
+        pairs (list): (시작, 끝) 청크 내 오프셋 쌍 리스트
+
         [반환값]
         list: 발견된 JPEG 파일 정보 리스트
-            각 항목: {"offset": int, "path": Path, "size": int}
+            각 항목: {"offset": int, "start": int, "size": int}
+            (save_local=True면 "path"도 포함)
         """
-        # JPEG 시그니처 정의
-        # b"..." : 바이트 리터럴 (문자열이 아닌 바이트 시퀀스)
-        SOI = b"\xff\xd8"  # Start Of Image - JPEG 시작
-        EOI = b"\xff\xd9"  # End Of Image - JPEG 끝
-
         found = []     # 발견된 JPEG 파일 정보 리스트
         file_idx = 0   # 파일 인덱스 (파일명 생성용)
-        
-        # 청크 전체 크기 (진행률 계산용)
-        chunk_size = chunk_path.stat().st_size
-        
-        # 진행률 표시 객체 생성
-        progress = ProgressBar(chunk_size, "JPEG 카빙")
+        if not pairs:
+            return found
+
+        # 오프셋순 정렬 후, 이전 파일 내부에서 시작하는 매칭(경계 구간의
+        # 중첩 썸네일 등)은 단일 패스 검색과 동일한 결과가 되도록 제외
+        pairs.sort()
+        prev_end = 0
+
+        if not self.save_local:
+            # 구간 정보만 수집 (디스크 쓰기 없음)
+            for s, end in pairs:
+                if s < prev_end:
+                    continue  # 직전 파일에 포함된 구간
+                prev_end = end
+                found.append({
+                    "offset": base_offset + s,  # 원본에서의 위치
+                    "start": s,                 # 청크 내 시작 위치
+                    "size": end - s             # 파일 크기
+                })
+            return found
+
+        # os.sendfile: 파일 -> 파일 커널 내부 복사 (Linux)
+        # 매칭 구간이 사용자 공간을 거치지 않고 페이지 캐시에서
+        # 출력 파일로 바로 복사되므로 추출당 bytes 할당/복사가 없음
+        use_sendfile = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+        with open(chunk_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunk_fd = f.fileno()
+            for s, end in pairs:
+                if s < prev_end:
+                    continue  # 직전 파일에 포함된 구간
+                prev_end = end
+
+                # 원본 DD 이미지에서의 절대 오프셋 계산
+                abs_offset = base_offset + s
+
+                # JPEG 파일 저장
+                # 파일명 형식: worker_워커ID_off오프셋_idx인덱스.jpg
+                out_name = self.local_out_dir / f"worker_{self.worker_id}_off{abs_offset}_idx{file_idx}.jpg"
+
+                out_fd = os.open(out_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    copied_in_kernel = False
+                    if use_sendfile:
+                        try:
+                            # 커널 내부 복사 (오프셋 지정, 부분 복사 대비 루프)
+                            off, count = s, end - s
+                            while count > 0:
+                                n = os.sendfile(out_fd, chunk_fd, off, count)
+                                if n == 0:
+                                    raise OSError("sendfile returned 0")
+                                off += n
+                                count -= n
+                            copied_in_kernel = True
+                        except OSError:
+                            # 일부 커널/파일시스템은 일반 파일 간 sendfile 미지원
+                            # -> 이후 파일부터는 바로 슬라이스 경로 사용
+                            use_sendfile = False
+                            os.lseek(out_fd, 0, os.SEEK_SET)
+                            os.ftruncate(out_fd, 0)
+
+                    if not copied_in_kernel:
+                        # 폴백: 매칭 구간만 bytes로 복사하여 기록
+                        os.write(out_fd, mm[s:end])
+                finally:
+                    os.close(out_fd)
+
+                # 발견 정보 저장
+                found.append({
+                    "offset": abs_offset,   # 원본에서의 위치
+                    "start": s,             # 청크 내 시작 위치
+                    "path": out_name,       # 로컬 저장 경로
+                    "size": end - s         # 파일 크기
+                })
+                file_idx += 1
 
-        # 청크 파일 열기 ("rb": read binary)
-        with open(chunk_path, "rb") as f:
-            file_pos = 0    # 현재 파일 읽기 위치
-            carry = b""     # 이전 블록에서 이월된 데이터 (tail)
-            carry_pos = 0   # carry의 청크 내 시작 위치
-
-            while True:
-                # 블록 단위로 파일 읽기
-                data = f.read(scan_block)
-                if not data:
-                    break  # 파일 끝
-
-                # 이월된 데이터(carry)와 새 데이터 합치기
-                # 블록 경계에 걸친 시그니처를 놓치지 않기 위함
-                buf = carry + data
-                
-                # buf[0]이 해당하는 청크 내 위치
-                buf_start_pos = carry_pos
-                
-                # 다음 iteration을 위한 carry 준비
-                # buf의 마지막 tail_keep 바이트를 다음으로 이월
-                if len(buf) > tail_keep:
-                    next_carry = buf[-tail_keep:]  # 뒤에서 tail_keep 만큼
-                    next_carry_pos = buf_start_pos + (len(buf) - tail_keep)
-                else:
-                    next_carry = buf
-                    next_carry_pos = buf_start_pos
-
-                # 현재 buf에서 JPEG 검색
-                idx = 0  # buf 내 검색 시작 위치
-                
-                while True:
-                    # SOI (FF D8) 찾기
-                    # find(pattern, start): start 위치부터 pattern 검색
-                    # 반환값: 찾은 위치 (없으면 -1)
-                    s = buf.find(SOI, idx)
-                    if s < 0:
-                        break  # SOI 없음 -> 다음 블록으로
-                    
-                    # SOI 발견! 이후에서 EOI (FF D9) 찾기
-                    e = buf.find(EOI, s + 2)  # SOI 다음부터 검색
-                    if e < 0:
-                        # EOI가 현재 buf에 없음
-                        # 파일이 다음 블록에 걸쳐있을 수 있음
-                        # 단순화를 위해 현재는 스킵 (완전한 구현은 상태 유지 필요)
-                        idx = s + 2  # SOI 다음부터 다시 검색
-                        continue
-
-                    # JPEG 데이터 추출 (SOI부터 EOI까지, EOI 포함)
-                    # buf[s:e+2]: s부터 e+1까지 (슬라이싱은 끝 인덱스 미포함)
-                    jpg_bytes = buf[s : e + 2]
-                    
-                    # 원본 DD 이미지에서의 절대 오프셋 계산
-                    # base_offset: 청크의 시작 오프셋
-                    # buf_start_pos: buf의 청크 내 위치
-                    # s: buf 내에서의 SOI 위치
-                    abs_offset = base_offset + (buf_start_pos + s)
-
-                    # JPEG 파일 저장
-                    # 파일명 형식: worker_워커ID_off오프셋_idx인덱스.jpg
-                    out_name = self.local_out_dir / f"worker_{self.worker_id}_off{abs_offset}_idx{file_idx}.jpg"
-                    
-                    with open(out_name, "wb") as out:
-                        out.write(jpg_bytes)
-
-                    # 발견 정보 저장
-                    found.append({
-                        "offset": abs_offset,        # 원본에서의 위치
-                        "path": out_name,            # 로컬 저장 경로
-                        "size": out_name.stat().st_size  # 파일 크기
-                    })
-                    file_idx += 1
-
-                    # EOI 다음부터 계속 검색 (하나의 청크에 여러 JPEG 가능)
-                    idx = e + 2
-
-                # 다음 iteration 준비
-                carry = next_carry
-                carry_pos = next_carry_pos
-                file_pos += len(data)
-                
-                # 진행률 업데이트
-                progress.update(len(data))
-
-        # 완료 메시지 출력
-        progress.finish()
         return found
 
     # ========================================================================
@@ -711,12 +1223,33 @@ class FileCarvingWorker:
         # AF_INET: IPv4 주소 체계
         # SOCK_STREAM: TCP (연결 지향, 신뢰성 있는 통신)
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        
+
         # connect(): 서버에 연결
         # (host, port) 튜플로 연결 대상 지정
         # 연결 실패 시 ConnectionRefusedError 등 예외 발생
         self.socket.connect((self.master_host, self.master_port))
 
+        # ---- 소켓 성능 튜닝 ----
+        # TCP_NODELAY: Nagle 알고리즘 비활성화
+        # JSON 제어 메시지는 수십 바이트 수준이라 Nagle의 병합 대기가
+        # 태스크 왕복 지연만 키움
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # 송수신 버퍼를 16MB로 확대
+        # 고대역폭 링크에서 BDP(대역폭 x 지연)만큼 데이터가 비행 중일 수
+        # 있어야 링크를 가득 채울 수 있음
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUF_SIZE)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUF_SIZE)
+
+        # SO_ZEROCOPY: Linux에서 대용량 send의 커널 복사 생략 허용
+        # 미지원 커널/플랫폼이면 조용히 일반 sendall로 동작
+        if sys.platform.startswith("linux"):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, SO_ZEROCOPY, 1)
+                self._zerocopy = True
+            except OSError:
+                self._zerocopy = False
+
         # 워커 ID 생성
         # getsockname(): 이 소켓의 로컬 주소 반환 (IP, 포트)
         # 로컬 포트 번호를 ID로 사용 (같은 PC에서 여러 워커 구분 가능)
@@ -735,26 +1268,37 @@ class FileCarvingWorker:
     def run_once(self):
         """
         마스터로부터 작업을 받아 한 번 처리합니다.
-        
+
         [처리 흐름]
         1. 작업 정보(task) JSON 수신
-        2. 청크 데이터를 임시 파일로 수신
-        3. 임시 파일에서 JPEG 카빙
-        4. 결과 개수 JSON 전송
-        5. 각 JPEG 파일의 메타데이터와 데이터 전송
-        
+        2. 청크 데이터를 수신하면서 동시에 JPEG 카빙 (파이프라인)
+        3. 결과 개수 JSON 전송
+        4. 각 JPEG 파일의 메타데이터와 데이터 전송
+
+        [연결 재사용]
+        같은 연결로 여러 작업을 연달아 처리할 수 있습니다.
+        마스터가 연결을 닫으면(recv_json이 None 반환) 더 이상 작업이
+        없는 것으로 보고 False를 반환합니다. 작업마다 재연결하면
+        TCP 핸드셰이크 + 슬로우 스타트를 다시 치러야 하므로,
+        run() 루프가 이 메서드를 연결이 닫힐 때까지 반복 호출합니다.
+
         [임시 디렉토리 사용]
         tempfile.TemporaryDirectory()를 사용하면
         with 블록이 끝날 때 자동으로 디렉토리와 내용이 삭제됩니다.
         대용량 청크가 디스크에 남지 않도록 합니다.
+
+        [반환값]
+        bool: 작업을 하나 처리했으면 True,
+              연결이 닫혀 더 이상 작업이 없으면 False
         """
         print("[워커] 작업 대기 중...")
-        
+
         # 1. 작업 정보 수신
         task = self.recv_json()
         if not task:
-            print("[워커] 작업 수신 실패")
-            return
+            # 마스터가 연결을 닫음 = 배분할 작업이 더 없음
+            print("[워커] 마스터가 연결을 종료했습니다 (남은 작업 없음)")
+            return False
 
         # 작업 정보 추출
         task_id = task["task_id"]
@@ -774,21 +1318,22 @@ class FileCarvingWorker:
             td = Path(td)  # 문자열 -> Path 객체 변환
             chunk_path = td / f"chunk_task{task_id}.bin"  # 청크 파일 경로
 
-            # 청크 데이터 수신 (진행률 표시)
-            received = self.recv_binary_stream_to_file_with_progress(chunk_path)
-            
-            if received <= 0:
-                # 수신 실패 시 빈 결과 전송
-                self.send_json({"task_id": task_id, "recovered_count": 0})
-                return
-
-            # 3. JPEG 카빙 (진행률 표시)
-            print()  # 줄바꿈
-            recovered = self.carve_jpeg_from_file_with_progress(
-                chunk_path, 
+            # 청크 수신 + 카빙 동시 진행 (진행률 표시)
+            received, recovered = self.recv_and_carve_with_progress(
+                chunk_path,
                 base_offset=read_start
             )
 
+            if received < 0:
+                # 청크 수신 중 연결이 끊김 -> 더 진행할 수 없음
+                print("[워커] 청크 수신 실패 (연결 끊김)")
+                return False
+
+            if received == 0:
+                # 빈 청크: 빈 결과만 보내고 다음 작업 대기
+                self.send_json({"task_id": task_id, "recovered_count": 0})
+                return True
+
             print(f"\n[워커] 카빙 완료! {len(recovered)}개 JPEG 발견")
 
             # 4. 결과 개수 전송
@@ -797,32 +1342,88 @@ class FileCarvingWorker:
                 "recovered_count": len(recovered)
             })
 
-            # 5. 각 JPEG 파일 전송
+            # 5. 각 JPEG 파일 전송 (청크 파일에서 바로 읽어 전송)
+            # 복구 구간을 .jpg로 저장했다가 다시 여는 대신, 청크 파일의
+            # 해당 구간을 그대로 보냄 (구간 데이터는 이미 페이지 캐시에 있음)
             if recovered:
                 print(f"[워커] 마스터로 결과 전송 중...")
-                
-                for i, item in enumerate(recovered):
-                    # 메타데이터 전송
-                    meta = {
-                        "offset": int(item["offset"]),  # 원본에서의 위치
-                        "size": int(item["size"])       # 파일 크기
-                    }
-                    self.send_json(meta)
-                    
-                    # 파일 데이터 전송 (진행률 표시)
-                    self.send_binary_stream_from_file_with_progress(
-                        Path(item["path"]), 
-                        i,              # 현재 파일 번호
-                        len(recovered)  # 전체 파일 수
-                    )
-                
+
+                # 작은 파일(512KB 이하)은 프레임(헤더+데이터)을 여러 개 모아
+                # 한 번의 sendmsg로 전송 (썸네일 수백 개 시나리오에서
+                # 파일당 5개꼴이던 시스템 콜이 배치당 1개로 줄어듦)
+                batch = []        # 전송 대기 중인 버퍼 목록
+                batch_bytes = 0   # 배치에 쌓인 총 바이트
+
+                def flush_batch():
+                    nonlocal batch_bytes
+                    if batch:
+                        self._send_vec(batch)
+                        batch.clear()
+                        batch_bytes = 0
+
+                chunk_fd = os.open(chunk_path, os.O_RDONLY)
+                try:
+                    for i, item in enumerate(recovered):
+                        meta = {
+                            "offset": int(item["offset"]),  # 원본에서의 위치
+                            "size": int(item["size"])       # 파일 크기
+                        }
+                        size = int(item["size"])
+                        start = int(item["start"])  # 청크 내 시작 위치
+
+                        if size <= SMALL_RESULT_MAX:
+                            # 프레임을 배치에 적재
+                            meta_payload = json_dumps_bytes(meta)
+                            batch.append(
+                                JSON_LEN_STRUCT.pack(len(meta_payload))
+                                + meta_payload
+                                + BIN_LEN_STRUCT.pack(size))
+                            batch.append(_pread(chunk_fd, size, start))
+                            batch_bytes += size
+
+                            # 배치가 차면 전송 (버퍼 수/총량 제한)
+                            if (len(batch) >= RESULT_BATCH_MAX_BUFS
+                                    or batch_bytes >= RESULT_BATCH_MAX_BYTES):
+                                flush_batch()
+                        else:
+                            # 큰 파일은 순서 유지를 위해 먼저 배치를 비우고
+                            # sendfile 스트리밍 경로(진행률 표시)로 전송
+                            flush_batch()
+                            self.send_result_from_chunk(
+                                meta,
+                                chunk_fd,
+                                start,
+                                size,
+                                i,              # 현재 파일 번호
+                                len(recovered)  # 전체 파일 수
+                            )
+
+                    # 남은 배치 전송
+                    flush_batch()
+                finally:
+                    os.close(chunk_fd)
+
                 print(f"[워커] 모든 결과 전송 완료!")
             
             print("\n[워커] 작업 완료!")
-            
+
             # with 블록 끝 -> 임시 디렉토리 자동 삭제
             # 청크 파일은 삭제되지만, local_out_dir의 JPEG는 유지됨
 
+        return True
+
+    def run(self):
+        """
+        연결이 닫힐 때까지 작업을 반복 처리합니다.
+
+        마스터가 한 워커에게 작업을 여러 개 보내는 구성(작업 큐 방식)
+        에서도 연결 하나로 전부 처리합니다. 현재 마스터는 워커당 작업을
+        하나만 보내므로 한 번 돌고 끝나지만, 프로토콜상 추가 비용은
+        없습니다.
+        """
+        while self.run_once():
+            pass
+
     def close(self):
         """
         소켓 연결을 종료합니다.
@@ -832,7 +1433,12 @@ class FileCarvingWorker:
         에러 없이 조용히 처리합니다.
         """
         try:
+            # 종료 전 zero-copy 완료 통지 회수 (버퍼 참조 해제)
+            self._drain_zerocopy(wait=True)
             self.socket.close()
+            # 소켓이 닫히면 커널의 페이지 참조도 풀리므로 이제 안전
+            self._zc_pending.clear()
+            self._zc_graveyard.clear()
         except Exception:
             pass  # 에러 무시
 
@@ -868,7 +1474,9 @@ def main():
     # 옵션 인자 (선택)
     parser.add_argument("--block", "-b", type=int, default=4,
                         help="전송 블록 크기(MB), 기본 4MB")
-    
+    parser.add_argument("--save-local", action="store_true",
+                        help="복구된 JPEG을 로컬에도 파일로 저장 (디버깅/보관용)")
+
     # 인자 파싱
     args = parser.parse_args()
 
@@ -881,15 +1489,16 @@ def main():
     # MB -> 바이트 변환: * 1024 * 1024
     worker = FileCarvingWorker(
         args.host, 
-        args.port, 
-        stream_block_size=args.block * 1024 * 1024
+        args.port,
+        stream_block_size=args.block * 1024 * 1024,
+        save_local=args.save_local
     )
     
     try:
-        # 마스터에 연결하고 작업 수행
+        # 마스터에 연결하고 연결이 닫힐 때까지 작업 수행
         worker.connect()
-        worker.run_once()
-        
+        worker.run()
+
     except ConnectionRefusedError:
         # 마스터 서버가 실행 중이지 않거나 잘못된 주소
         print(f"[워커] 오류: 마스터 서버에 연결할 수 없습니다 ({args.host}:{args.port})")